@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Any, Generic, TypeVar, Literal
 from app.domain.entities.item import Item
 
@@ -12,16 +12,23 @@ class ApiResponse(BaseModel):
 
 class SuccessResponse(ApiResponse, Generic[T]):
     """Respuesta satisfactoria con los datos de un producto."""
-    code: Literal["OK"] = Field("OK", description="Código de resultado en caso exitoso (OK).", example="OK")
+    model_config = ConfigDict(json_schema_extra={"example": {"code": "OK", "status": 200, "data": {}}})
+    code: Literal["OK"] = Field("OK", description="Código de resultado en caso exitoso (OK).")
     status: int = Field(200, description="Código HTTP 200 indicando éxito.")
     data: T = Field(..., description="Datos de respuesta.")
 
 class ErrorResponse(ApiResponse):
     """Respuesta de error con detalles del problema."""
-    code: str = Field(..., description="Código de error ocurrido (por ejemplo, not_found, bad_request).", example="not_found")
-    message: str = Field(..., description="Mensaje descriptivo del error.", example="Item with id MLA123456789 not found")
-    status: int = Field(..., description="Código HTTP correspondiente al error.", example=404)
-    cause: Optional[List[Any]] = Field([], description="Lista de causas adicionales del error, si aplican.", example=[])
+    model_config = ConfigDict(json_schema_extra={"example": {
+        "code": "not_found",
+        "message": "Item with id MLA123456789 not found",
+        "status": 404,
+        "cause": []
+    }})
+    code: str = Field(..., description="Código de error ocurrido (por ejemplo, not_found, bad_request).")
+    message: str = Field(..., description="Mensaje descriptivo del error.")
+    status: int = Field(..., description="Código HTTP correspondiente al error.")
+    cause: Optional[List[Any]] = Field([], description="Lista de causas adicionales del error, si aplican.")
 
 # Nuevos tipos para respuestas directas (sin capa 'data')
 class DirectSuccessResponse(BaseModel):
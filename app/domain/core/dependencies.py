@@ -8,6 +8,10 @@ from app.infrastructure.repositories.json_item_repository import JsonItemReposit
 from app.domain.services.item_service import ItemService
 from app.domain.services.search_service import SearchService
 from app.presentation.controllers.item_controller import ItemController
+from app.infrastructure.cache.response_cache import ResponseCache
+from app.infrastructure.cache.item_json_cache import ItemJsonCache
+from app.presentation.coalescer import Coalescer
+from app.infrastructure.config.config import get_settings
 
 
 @lru_cache()
@@ -45,7 +49,11 @@ def get_search_service() -> SearchService:
         Instancia del servicio de búsqueda
     """
     repository = get_item_repository()
-    return SearchService(repository)
+    service = SearchService(repository)
+    service.precompute_recommendations()
+    # Las recomendaciones precalculadas se regeneran al recargar el catálogo
+    repository.add_reload_listener(service.precompute_recommendations)
+    return service
 
 
 @lru_cache()
@@ -59,4 +67,49 @@ def get_item_controller() -> ItemController:
     """
     item_service = get_item_service()
     search_service = get_search_service()
-    return ItemController(item_service, search_service)
+    controller = ItemController(item_service, search_service)
+    # Los listados memorizados por el controlador se descartan al recargar el catálogo
+    get_item_repository().add_reload_listener(controller.clear_cache)
+    return controller
+
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    """
+    Obtiene la caché de respuestas compartida por los endpoints.
+    
+    
+    Returns:
+        Instancia de la caché de respuestas
+    """
+    cache = ResponseCache(default_ttl=get_settings().cache_ttl)
+    # Las respuestas cacheadas se invalidan cuando cambia el catálogo
+    get_item_repository().add_reload_listener(cache.clear)
+    return cache
+
+
+@lru_cache()
+def get_item_json_cache() -> ItemJsonCache:
+    """
+    Obtiene la caché del JSON serializado de cada item.
+    
+    Returns:
+        Instancia de la caché de items serializados
+    """
+    cache = ItemJsonCache()
+    get_item_repository().add_reload_listener(cache.clear)
+    return cache
+
+
+@lru_cache()
+def get_coalescer() -> Coalescer:
+    """
+    Obtiene el agrupador de requests concurrentes usado por los endpoints.
+    
+    Returns:
+        Instancia del agrupador de ejecuciones en curso
+    """
+    coalescer = Coalescer()
+    # Una ejecución iniciada antes de recargar no se comparte con requests posteriores
+    get_item_repository().add_reload_listener(coalescer.clear)
+    return coalescer
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from decimal import Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money:
     """Objeto de valor para representar dinero."""
     amount: Decimal
@@ -16,7 +16,7 @@ class Money:
             raise ValueError("Currency cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Picture:
     """Objeto de valor para imágenes."""
     id: str
@@ -38,7 +38,7 @@ class Picture:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attribute:
     """Objeto de valor para atributos del producto."""
     id: str
@@ -60,7 +60,7 @@ class Attribute:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Shipping:
     """Objeto de valor para información de envío."""
     free_shipping: bool
@@ -78,7 +78,7 @@ class Shipping:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Seller:
     """Objeto de valor para información del vendedor."""
     id: str
@@ -92,7 +92,7 @@ class Seller:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """
     Entidad principal que representa un producto.
@@ -106,12 +106,12 @@ class Item:
     sold_quantity: int
     condition: str
     permalink: str
-    pictures: List[Picture]
-    attributes: List[Attribute]
+    pictures: Tuple[Picture, ...]
+    attributes: Tuple[Attribute, ...]
     shipping: Optional[Shipping] = None
     seller: Optional[Seller] = None
     warranty: Optional[str] = None
-    category_path: List[str] = None
+    category_path: Optional[Tuple[str, ...]] = None
     
     def __post_init__(self):
         """Validaciones de dominio."""
@@ -126,7 +126,7 @@ class Item:
         if not self.permalink:
             raise ValueError("Permalink cannot be empty")
         
-        # Hacer inmutables las listas
+        # Hacer inmutables las colecciones (tuple() no copia si ya son tuplas)
         object.__setattr__(self, 'pictures', tuple(self.pictures))
         object.__setattr__(self, 'attributes', tuple(self.attributes))
         if self.category_path:
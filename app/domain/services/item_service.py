@@ -41,6 +41,15 @@ class ItemService:
         
         return item
     
+    def get_last_modified(self) -> Optional[float]:
+        """
+        Obtiene el momento de la última modificación del catálogo.
+        
+        Returns:
+            Timestamp (epoch) de la última carga, o None si el repositorio no lo informa
+        """
+        return getattr(self._repository, 'loaded_at', None)
+    
     def get_all_items(self) -> List[Item]:
         """
         Obtiene todos los items.
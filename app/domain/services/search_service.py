@@ -1,9 +1,14 @@
-from typing import List, Optional, Tuple
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from app.domain.entities.item import Item
 from app.domain.repositories.item_repository import SearchableRepository, PaginatedRepository, SortableRepository
 from app.domain.core.exceptions import InvalidSearchCriteriaError
 
+# Cantidad de recomendaciones precalculadas por item (máximo k admitido por la API)
+RECOMMENDATIONS_DEPTH = 20
+
 
 @dataclass
 class SearchCriteria:
@@ -18,6 +23,7 @@ class SearchCriteria:
     min_price: Optional[float] = None
     max_price: Optional[float] = None
     available_only: bool = False
+    cursor: Optional[Tuple[Any, str]] = None
     
     def __post_init__(self):
         """Validaciones de criterios de búsqueda."""
@@ -41,10 +47,13 @@ class SearchResult:
     items: List[Item]
     total_count: int
     criteria: SearchCriteria
+    next_key: Optional[Tuple[Any, str]] = None
     
     @property
     def has_more(self) -> bool:
         """Verifica si hay más resultados disponibles."""
+        if self.criteria.cursor is not None:
+            return self.next_key is not None
         return self.criteria.offset + len(self.items) < self.total_count
     
     @property
@@ -58,6 +67,88 @@ class SearchResult:
         return (self.total_count + self.criteria.limit - 1) // self.criteria.limit
 
 
+@dataclass
+class SimilarityTable:
+    """
+    Atributos usados por el puntaje de similitud, guardados por columnas.
+    
+    Se extraen una sola vez por item, de modo que puntuar el catálogo no
+    recorre los atributos de cada candidato en cada comparación.
+    """
+    items: List[Item]
+    brands: List[Optional[str]]
+    main_categories: List[Optional[str]]
+    category_ids: List[str]
+    prices: List[float]
+    sold_quantities: List[int]
+    positions: Dict[str, int]
+    
+    @classmethod
+    def from_items(cls, items: List[Item]) -> "SimilarityTable":
+        """
+        Construye la tabla a partir de la lista de items.
+        
+        Args:
+            items: Items del catálogo, en orden
+            
+        Returns:
+            SimilarityTable con una columna por atributo
+        """
+        return cls(
+            items=items,
+            brands=[item.get_brand() for item in items],
+            main_categories=[item.get_main_category() for item in items],
+            category_ids=[item.category_id for item in items],
+            prices=[float(item.price.amount) for item in items],
+            sold_quantities=[item.sold_quantity for item in items],
+            positions={item.id: index for index, item in enumerate(items)}
+        )
+    
+    def rank_similar(self, item_id: str, k: int) -> List[Item]:
+        """
+        Obtiene los k items más similares a un item (excluyéndolo).
+        
+        Aplica las mismas reglas que Item.calculate_similarity_with: misma marca +3,
+        misma categoría principal +2, mismo category_id +1 y precio dentro del ±20% +1.
+        Ordena por puntaje y luego por cantidad vendida; ante empate gana el primero del catálogo.
+        
+        Args:
+            item_id: ID del item base
+            k: Número máximo de items a devolver
+            
+        Returns:
+            Lista de items similares, o vacía si el item no está en la tabla
+        """
+        base = self.positions.get(item_id)
+        if base is None:
+            return []
+        
+        brand = self.brands[base]
+        main_category = self.main_categories[base]
+        category_id = self.category_ids[base]
+        price = self.prices[base]
+        
+        scored = []
+        columns = zip(self.brands, self.main_categories, self.category_ids, self.prices, self.sold_quantities)
+        for index, (other_brand, other_main, other_category, other_price, sold) in enumerate(columns):
+            if index == base:
+                continue
+            score = 0.0
+            if brand and other_brand and brand == other_brand:
+                score += 3.0
+            if main_category and other_main and main_category == other_main:
+                score += 2.0
+            if category_id == other_category:
+                score += 1.0
+            highest = max(price, other_price)
+            if highest and abs(price - other_price) / highest <= 0.2:
+                score += 1.0
+            if score > 0:
+                scored.append((score, sold, -index))
+        
+        return [self.items[-index] for _, _, index in heapq.nlargest(k, scored)]
+
+
 class SearchService:
     """
     Servicio especializado en búsquedas y filtros.
@@ -72,6 +163,27 @@ class SearchService:
             repository: Repositorio que implementa SearchableRepository
         """
         self._repository = repository
+        self._recommendations: Optional[Dict[str, List[Item]]] = None
+        self._recommendations_depth = 0
+        self._similarity_table: Optional[SimilarityTable] = None
+    
+    def precompute_recommendations(self, depth: int = RECOMMENDATIONS_DEPTH) -> None:
+        """
+        Precalcula las recomendaciones de todos los items.
+        
+        Se ejecuta una vez al iniciar la aplicación, de modo que los requests
+        solo recortan la lista ya ordenada en lugar de puntuar todo el catálogo.
+        
+        Args:
+            depth: Cantidad de recomendaciones a guardar por item
+        """
+        table = self._load_similarity_table()
+        self._similarity_table = table
+        self._recommendations = {
+            item.id: table.rank_similar(item.id, depth)
+            for item in table.items
+        }
+        self._recommendations_depth = depth
     
     def search(self, criteria: SearchCriteria) -> SearchResult:
         """
@@ -83,12 +195,20 @@ class SearchService:
         Returns:
             Resultado de la búsqueda
         """
+        # Filtros que no pueden coincidir con ningún item: resultado vacío sin recorrer datos
+        if self._has_unknown_filters(criteria):
+            return SearchResult(items=[], total_count=0, criteria=criteria)
+        
         # Obtener items base según criterios
         items = self._get_base_items(criteria)
         
         # Aplicar filtros adicionales
         items = self._apply_filters(items, criteria)
         
+        # Paginación por cursor: continúa después de la última clave vista
+        if criteria.cursor is not None:
+            return self._search_after_cursor(items, criteria)
+        
         # Aplicar ordenamiento
         items = self._apply_sorting(items, criteria)
         
@@ -96,12 +216,77 @@ class SearchService:
         total_count = len(items)
         paginated_items = self._apply_pagination(items, criteria)
         
+        # Con orden explícito, la última clave de la página permite seguir por cursor
+        next_key = None
+        if criteria.sort_field and paginated_items and criteria.offset + len(paginated_items) < total_count:
+            next_key = self._keyset_key(paginated_items[-1], criteria.sort_field)
+        
         return SearchResult(
             items=paginated_items,
             total_count=total_count,
-            criteria=criteria
+            criteria=criteria,
+            next_key=next_key
         )
     
+    def _search_after_cursor(self, items: List[Item], criteria: SearchCriteria) -> SearchResult:
+        """
+        Devuelve la página que sigue a la clave del cursor.
+        
+        Usa el mismo orden que la paginación por offset (estable: los empates
+        conservan el orden del catálogo). Se ordena una sola vez y se ubica la
+        clave por búsqueda binaria sobre el valor de orden; dentro de los empates
+        el id del cursor indica dónde continuar.
+        
+        Args:
+            items: Items ya filtrados
+            criteria: Criterios de búsqueda con cursor
+            
+        Returns:
+            Resultado con la página y la clave del siguiente cursor
+            
+        Raises:
+            InvalidSearchCriteriaError: Si el cursor no corresponde al campo de orden
+        """
+        cursor_value, cursor_id = criteria.cursor
+        ordered = self._apply_sorting(items, criteria)
+        values = [self._keyset_key(item, criteria.sort_field)[0] for item in ordered]
+        
+        # Rango [low, high) de items empatados con el valor del cursor
+        try:
+            if criteria.sort_direction == "desc":
+                ascending = values[::-1]
+                low = len(values) - bisect_right(ascending, cursor_value)
+                high = len(values) - bisect_left(ascending, cursor_value)
+            else:
+                low = bisect_left(values, cursor_value)
+                high = bisect_right(values, cursor_value)
+        except TypeError:
+            raise InvalidSearchCriteriaError("cursor", str([cursor_value, cursor_id]), "Does not match the sort field")
+        
+        # Si el item del cursor ya no está (p. ej., tras recargar datos) se repiten
+        # los empates en lugar de saltearlos
+        start = low
+        for index in range(low, high):
+            if ordered[index].id == cursor_id:
+                start = index + 1
+                break
+        
+        page = ordered[start:start + criteria.limit]
+        next_key = None
+        if page and start + len(page) < len(ordered):
+            next_key = self._keyset_key(page[-1], criteria.sort_field)
+        
+        return SearchResult(
+            items=page,
+            total_count=len(items),
+            criteria=criteria,
+            next_key=next_key
+        )
+    
+    def _keyset_key(self, item: Item, sort_field: Optional[str]) -> Tuple[Any, str]:
+        """Clave del cursor de un item: valor del campo de orden e id para ubicarlo entre empates."""
+        return (self._get_sort_value(item, sort_field) if sort_field else "", item.id)
+    
     def search_by_term(self, query: str, limit: int = 10, offset: int = 0) -> SearchResult:
         """
         Búsqueda simple por término.
@@ -186,6 +371,25 @@ class SearchService:
         )
         return self.search(criteria)
     
+    def _has_unknown_filters(self, criteria: SearchCriteria) -> bool:
+        """Verifica si la categoría o marca que define los items base no existe.
+        
+        Solo se revisa el criterio que usa _get_base_items: con búsqueda por
+        texto la categoría y la marca se ignoran.
+        """
+        if criteria.query:
+            return False
+        
+        if criteria.category_id:
+            if hasattr(self._repository, 'has_category'):
+                return not self._repository.has_category(criteria.category_id)
+            return False
+        
+        if criteria.brand and hasattr(self._repository, 'has_brand'):
+            return not self._repository.has_brand(criteria.brand)
+        
+        return False
+    
     def _get_base_items(self, criteria: SearchCriteria) -> List[Item]:
         """Obtiene los items base según los criterios principales."""
         if criteria.query:
@@ -272,7 +476,8 @@ class SearchService:
         brand: Optional[str] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
-        available_only: bool = False
+        available_only: bool = False,
+        cursor: Optional[Tuple[Any, str]] = None
     ) -> SearchResult:
         """
         Método principal de búsqueda con todos los criterios.
@@ -288,6 +493,7 @@ class SearchService:
             min_price: Precio mínimo
             max_price: Precio máximo
             available_only: Solo items disponibles
+            cursor: Clave (valor de orden, id) del último item visto (opcional)
             
         Returns:
             SearchResult: Resultado de la búsqueda con datos y metadatos
@@ -302,7 +508,8 @@ class SearchService:
             brand=brand,
             min_price=min_price,
             max_price=max_price,
-            available_only=available_only
+            available_only=available_only,
+            cursor=cursor
         )
         return self.search(criteria)
     
@@ -317,31 +524,27 @@ class SearchService:
         Returns:
             Lista de items recomendados ordenados por similitud
         """
-        # Obtener el item base
-        base_item = None
-        if hasattr(self._repository, 'find_by_id'):
-            base_item = self._repository.find_by_id(item_id)
-        
-        if not base_item:
-            return []
-        
-        # Obtener todos los items excepto el base
-        all_items = []
-        if hasattr(self._repository, 'find_all'):
-            all_items = [item for item in self._repository.find_all() if item.id != item_id]
-        
-        # Calcular similitud y ordenar - usa lógica de dominio
-        scored_items = []
-        for item in all_items:
-            score = base_item.calculate_similarity_with(item)
-            if score > 0:  # Solo incluir items con alguna similitud
-                scored_items.append((item, score))
+        # Recomendaciones precalculadas: solo se recorta la lista
+        if self._recommendations is not None and k <= self._recommendations_depth:
+            precomputed = self._recommendations.get(item_id)
+            if precomputed is not None:
+                return precomputed[:k]
+        
+        table = self._similarity_table or self._load_similarity_table()
+        return table.rank_similar(item_id, k)
+    
+    def _load_similarity_table(self) -> SimilarityTable:
+        """
+        Obtiene la tabla de similitud del repositorio, o la construye si no la expone.
         
-        # Ordenar por score descendente, luego por popularidad
-        scored_items.sort(key=lambda x: (x[1], x[0].sold_quantity), reverse=True)
+        Returns:
+            SimilarityTable con los items del catálogo
+        """
+        if hasattr(self._repository, 'similarity_table'):
+            return self._repository.similarity_table()
         
-        # Retornar los top k items
-        return [item for item, score in scored_items[:k]]
+        all_items = self._repository.find_all() if hasattr(self._repository, 'find_all') else []
+        return SimilarityTable.from_items(all_items)
     
     def get_popular_items(self, limit: int = 10) -> List[Item]:
         """
@@ -353,6 +556,10 @@ class SearchService:
         Returns:
             Lista de items populares ordenados por cantidad vendida
         """
+        # Orden precalculado por el repositorio
+        if hasattr(self._repository, 'find_most_sold'):
+            return self._repository.find_most_sold(limit)
+        
         all_items = []
         if hasattr(self._repository, 'find_all'):
             all_items = self._repository.find_all()
@@ -376,6 +583,10 @@ class SearchService:
         Returns:
             Lista de items disponibles ordenados por cantidad de stock
         """
+        # Orden precalculado por el repositorio
+        if hasattr(self._repository, 'find_most_available'):
+            return self._repository.find_most_available(limit)
+        
         all_items = []
         if hasattr(self._repository, 'find_all'):
             all_items = self._repository.find_all()
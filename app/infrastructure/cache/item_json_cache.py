@@ -0,0 +1,51 @@
+"""
+Caché del JSON serializado de cada item.
+Los items del catálogo no cambian entre recargas, por lo que cada uno se
+serializa una sola vez y las respuestas se arman concatenando bytes.
+"""
+
+from typing import Dict, Iterable
+from app.domain.entities.item import Item
+from app.infrastructure.serialization import dumps
+
+
+class ItemJsonCache:
+    """
+    Guarda el cuerpo JSON de cada item indexado por su ID.
+    Debe limpiarse cuando el repositorio recarga los datos.
+    """
+
+    def __init__(self) -> None:
+        self._encoded: Dict[str, bytes] = {}
+
+    def encode(self, item: Item) -> bytes:
+        """
+        Obtiene el JSON del item, serializándolo solo la primera vez.
+
+        Args:
+            item: Item del catálogo
+
+        Returns:
+            bytes: Item serializado con el mismo formato que Item.to_dict()
+        """
+        body = self._encoded.get(item.id)
+        if body is None:
+            body = dumps(item.to_dict())
+            self._encoded[item.id] = body
+        return body
+
+    def encode_list(self, items: Iterable[Item]) -> bytes:
+        """
+        Serializa una lista de items como arreglo JSON.
+
+        Args:
+            items: Items a serializar, en orden
+
+        Returns:
+            bytes: Arreglo JSON con el cuerpo de cada item
+        """
+        return b"[" + b",".join(self.encode(item) for item in items) + b"]"
+
+    def clear(self) -> None:
+        """Descarta todos los cuerpos serializados."""
+        self._encoded.clear()
@@ -0,0 +1,74 @@
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Caché en memoria de respuestas serializadas, organizada por espacios de nombres.
+    Cada entrada expira según su TTL y cada espacio tiene un tamaño máximo.
+    """
+    
+    def __init__(self, default_ttl: int = 300, max_entries: int = 1024):
+        """
+        Inicializa la caché.
+        
+        Args:
+            default_ttl: Tiempo de vida por defecto de las entradas (segundos)
+            max_entries: Cantidad máxima de entradas por espacio de nombres
+        """
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._namespaces: Dict[str, Dict[Hashable, Tuple[float, Any]]] = {}
+    
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene una entrada vigente.
+        
+        Args:
+            namespace: Espacio de nombres (por ejemplo, el endpoint)
+            key: Clave construida con los parámetros del request
+            
+        Returns:
+            Valor guardado, o None si no existe o expiró
+        """
+        entries = self._namespaces.get(namespace)
+        if not entries:
+            return None
+        
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            entries.pop(key, None)
+            return None
+        return value
+    
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Guarda una entrada.
+        
+        Args:
+            namespace: Espacio de nombres
+            key: Clave de la entrada
+            value: Valor a guardar
+            ttl: Tiempo de vida en segundos (opcional, usa el valor por defecto)
+        """
+        entries = self._namespaces.setdefault(namespace, {})
+        if key not in entries and len(entries) >= self._max_entries:
+            # Se descarta la entrada más antigua (orden de inserción)
+            entries.pop(next(iter(entries)))
+        entries[key] = (time.monotonic() + (ttl or self._default_ttl), value)
+    
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Elimina las entradas de un espacio de nombres, o todas si no se indica.
+        
+        Args:
+            namespace: Espacio de nombres a limpiar (opcional)
+        """
+        if namespace is None:
+            self._namespaces.clear()
+        else:
+            self._namespaces.pop(namespace, None)
@@ -20,7 +20,9 @@ class Settings(BaseModel):
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
     # Configuración de performance
-    cache_ttl: int = 300  # 5 minutos
+    # Vida de las respuestas cacheadas (segundos). Es larga porque la caché
+    # se invalida explícitamente al recargar el catálogo
+    cache_ttl: int = 3600
     max_search_results: int = 100
     
 # Instancia global de configuración
@@ -13,6 +13,7 @@ class EnvConfig:
     """Configuración centralizada de variables de entorno."""
     
     # Configuración de la aplicación
+    ENV: str = os.getenv("ENV", "dev")
     APP_PORT: int = int(os.getenv("APP_PORT", "8000"))
     DATA_SOURCE: str = os.getenv("DATA_SOURCE", "json")
     DATA_DIR: str = os.getenv("DATA_DIR", "app/infrastructure/data")
@@ -26,6 +27,16 @@ class EnvConfig:
     CORS_METHODS: list = os.getenv("CORS_METHODS", "GET,POST").split(",")
     CORS_HEADERS: list = os.getenv("CORS_HEADERS", "X-API-Key,Content-Type,Authorization").split(",")
     
+    @classmethod
+    def is_production(cls) -> bool:
+        """
+        Indica si la aplicación corre en producción.
+        
+        Returns:
+            bool: True si ENV es "prod" o "production"
+        """
+        return cls.ENV.lower() in ("prod", "production")
+    
     @classmethod
     def get_api_keys(cls) -> set:
         """
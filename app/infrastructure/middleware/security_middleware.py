@@ -1,3 +1,4 @@
+import hmac
 import time
 import secrets
 from typing import Optional, Dict, Any
@@ -22,8 +23,9 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     
     def __init__(self, app, api_keys: Optional[set] = None):
         super().__init__(app)
-        # API Keys desde variables de entorno
-        self.api_keys = api_keys or config.get_api_keys()
+        # API Keys desde variables de entorno, fijas durante la vida del proceso
+        self.api_keys = frozenset(api_keys or config.get_api_keys())
+        self._api_key_bytes = tuple(key.encode() for key in self.api_keys)
         
         # Rate limiting desde configuración
         self.rate_limit_requests = config.RATE_LIMIT_REQUESTS
@@ -123,7 +125,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             }
         
         # Verificar si la API Key es válida
-        if api_key in self.api_keys:
+        if self._is_valid_api_key(api_key):
             return {
                 "valid": True,
                 "message": "Authentication successful",
@@ -136,6 +138,19 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             "api_key": api_key
         }
     
+    def _is_valid_api_key(self, api_key: str) -> bool:
+        """
+        Compara la API Key contra cada clave válida en tiempo constante.
+        
+        Se recorren todas las claves sin cortar en la primera coincidencia,
+        de modo que el tiempo de respuesta no revela qué parte coincide.
+        """
+        candidate = api_key.encode()
+        valid = False
+        for key in self._api_key_bytes:
+            valid |= hmac.compare_digest(candidate, key)
+        return valid
+    
     def _check_rate_limit(self, request: Request) -> bool:
         """
         Implementa rate limiting básico por IP.
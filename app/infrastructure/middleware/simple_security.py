@@ -1,11 +1,24 @@
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+import hmac
 import time
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+API_KEY_ROLES = {
+    "ml-api-key-admin-2024": "admin",
+    "ml-api-key-user-2024": "user",
+    "ml-api-key-readonly-2024": "readonly"
+}
+PUBLIC_ROUTES = frozenset({"/docs", "/redoc", "/openapi.json", "/test", "/api/v1/health", "/"})
+
+# Claves ya codificadas para compararlas en tiempo constante
+_API_KEY_ROLE_BYTES = tuple((key.encode(), role) for key, role in API_KEY_ROLES.items())
+
+
 class SimpleSecurityMiddleware(BaseHTTPMiddleware):
     """
     Middleware de seguridad simplificado que solo agrega headers básicos
@@ -15,12 +28,8 @@ class SimpleSecurityMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, enable_api_key_auth: bool = False):
         super().__init__(app)
         self.enable_api_key_auth = enable_api_key_auth
-        self.api_keys = {
-            "ml-api-key-admin-2024": "admin",
-            "ml-api-key-user-2024": "user",
-            "ml-api-key-readonly-2024": "readonly"
-        }
-        self.public_routes = {"/docs", "/redoc", "/openapi.json", "/test", "/api/v1/health", "/"}
+        self.api_keys = API_KEY_ROLES
+        self.public_routes = PUBLIC_ROUTES
     
     async def dispatch(self, request: Request, call_next):
         start_time = time.time()
@@ -29,7 +38,8 @@ class SimpleSecurityMiddleware(BaseHTTPMiddleware):
         if self.enable_api_key_auth and request.url.path not in self.public_routes:
             api_key = request.headers.get("X-API-Key") or request.query_params.get("api_key")
             
-            if not api_key or api_key not in self.api_keys:
+            role = _resolve_role(api_key) if api_key else None
+            if role is None:
                 return JSONResponse(
                     status_code=401,
                     content={
@@ -41,7 +51,7 @@ class SimpleSecurityMiddleware(BaseHTTPMiddleware):
                 )
             
             
-            request.state.user_role = self.api_keys[api_key]
+            request.state.user_role = role
             request.state.api_key = api_key
         
         
@@ -57,3 +67,21 @@ class SimpleSecurityMiddleware(BaseHTTPMiddleware):
         logger.info(f"REQUEST: {request.method} {request.url.path} - {response.status_code} - {duration:.3f}s")
         
         return response
+
+
+def _resolve_role(api_key: str) -> Optional[str]:
+    """
+    Obtiene el rol asociado a una API Key comparando en tiempo constante.
+    
+    Args:
+        api_key: API Key recibida en el request
+        
+    Returns:
+        Rol de la clave, o None si no es válida
+    """
+    candidate = api_key.encode()
+    role = None
+    for key, key_role in _API_KEY_ROLE_BYTES:
+        if hmac.compare_digest(candidate, key):
+            role = key_role
+    return role
@@ -1,9 +1,12 @@
 import json
+import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from app.domain.entities.item import Item
 from app.domain.repositories.item_repository import ItemRepositoryInterface
+from app.domain.services.search_service import SimilarityTable
 from app.infrastructure.serializers.item_serializer import ItemSerializer
+from app.infrastructure.repositories.text_index import TextSearchIndex
 from app.domain.core.exceptions import FileNotFoundError, SerializationError
 from app.infrastructure.config.config import get_settings
 
@@ -25,8 +28,22 @@ class JsonItemRepository(ItemRepositoryInterface):
         self._data_file = Path(data_file_path or f"{settings.data_dir}/items.json")
         self._items: List[Item] = []
         self._items_by_id: Dict[str, Item] = {}
+        self._positions: Dict[str, int] = {}
+        self._text_index = TextSearchIndex()
+        self._items_by_category: Dict[str, List[Item]] = {}
+        self._items_by_brand: Dict[str, List[Item]] = {}
+        self._by_sold: List[Item] = []
+        self._available_by_stock: List[Item] = []
+        self._similarity_table = SimilarityTable.from_items([])
+        self._loaded_at: float = 0.0
+        self._reload_listeners: List[Callable[[], None]] = []
         self._load_data()
     
+    @property
+    def loaded_at(self) -> float:
+        """Timestamp (epoch) de la última carga de datos."""
+        return self._loaded_at
+    
     def find_by_id(self, item_id: str) -> Optional[Item]:
         """Busca un item por su ID."""
         return self._items_by_id.get(item_id)
@@ -35,6 +52,14 @@ class JsonItemRepository(ItemRepositoryInterface):
         """Obtiene todos los items."""
         return self._items.copy()
     
+    def first(self) -> Optional[Item]:
+        """Obtiene el primer item del catálogo sin copiar la lista."""
+        return self._items[0] if self._items else None
+    
+    def count(self) -> int:
+        """Obtiene la cantidad de items cargados."""
+        return len(self._items)
+    
     def exists(self, item_id: str) -> bool:
         """Verifica si existe un item con el ID especificado."""
         return item_id in self._items_by_id
@@ -44,24 +69,49 @@ class JsonItemRepository(ItemRepositoryInterface):
         if not search_term:
             return self._items.copy()
         
+        candidate_ids = self._text_index.candidates(search_term)
+        if candidate_ids is None:
+            # Término sin tokens indexables: recorrido completo
+            candidates = self._items
+        else:
+            # Se conserva el orden del catálogo ordenando solo los candidatos
+            candidates = [
+                self._items_by_id[item_id]
+                for item_id in sorted(candidate_ids, key=self._positions.__getitem__)
+            ]
+        
         return [
-            item for item in self._items
+            item for item in candidates
             if item.matches_search_term(search_term)
         ]
     
+    def find_most_sold(self, limit: int) -> List[Item]:
+        """Obtiene los items más vendidos (orden precalculado al cargar los datos)."""
+        return self._by_sold[:limit]
+    
+    def find_most_available(self, limit: int) -> List[Item]:
+        """Obtiene los items con stock, de mayor a menor cantidad disponible (orden precalculado)."""
+        return self._available_by_stock[:limit]
+    
+    def similarity_table(self) -> SimilarityTable:
+        """Obtiene la tabla de atributos de similitud (construida al cargar los datos)."""
+        return self._similarity_table
+    
+    def has_category(self, category_id: str) -> bool:
+        """Verifica si existe al menos un item de la categoría."""
+        return category_id in self._items_by_category
+    
+    def has_brand(self, brand: str) -> bool:
+        """Verifica si existe al menos un item de la marca (sin distinguir mayúsculas)."""
+        return brand.lower() in self._items_by_brand
+    
     def search_by_category(self, category_id: str) -> List[Item]:
-        """Busca items por categoría."""
-        return [
-            item for item in self._items
-            if item.category_id == category_id
-        ]
+        """Busca items por categoría (índice construido al cargar los datos)."""
+        return list(self._items_by_category.get(category_id, ()))
     
     def search_by_brand(self, brand: str) -> List[Item]:
-        """Busca items por marca."""
-        return [
-            item for item in self._items
-            if item.get_brand() and item.get_brand().lower() == brand.lower()
-        ]
+        """Busca items por marca, sin distinguir mayúsculas (índice construido al cargar los datos)."""
+        return list(self._items_by_brand.get(brand.lower(), ()))
     
     def find_all_paginated(self, limit: int, offset: int) -> tuple[List[Item], int]:
         """Obtiene items con paginación."""
@@ -112,6 +162,8 @@ class JsonItemRepository(ItemRepositoryInterface):
             
             self._items = []
             self._items_by_id = {}
+            self._positions = {}
+            self._text_index = TextSearchIndex()
             
             for item_data in raw_data:
                 try:
@@ -120,10 +172,30 @@ class JsonItemRepository(ItemRepositoryInterface):
                     item = ItemSerializer.from_dict(item_data)
                     self._items.append(item)
                     self._items_by_id[item.id] = item
+                    self._positions[item.id] = len(self._items) - 1
+                    self._text_index.add(item.id, (item.title, item.get_brand(), item.get_model()))
                 except Exception as e:
                     # Log error but continue loading other items
                     print(f"Error loading item {item_data.get('id', 'unknown')}: {e}")
                     continue
+            
+            self._loaded_at = time.time()
+            # Índices por categoría y marca, en el orden del catálogo
+            self._items_by_category = {}
+            self._items_by_brand = {}
+            for item in self._items:
+                self._items_by_category.setdefault(item.category_id, []).append(item)
+                brand = item.get_brand()
+                if brand:
+                    self._items_by_brand.setdefault(brand.lower(), []).append(item)
+            # Órdenes fijos de los listados: solo cambian al recargar los datos
+            self._by_sold = sorted(self._items, key=lambda item: item.sold_quantity, reverse=True)
+            self._available_by_stock = sorted(
+                (item for item in self._items if item.is_available),
+                key=lambda item: item.available_quantity,
+                reverse=True
+            )
+            self._similarity_table = SimilarityTable.from_items(self._items)
                     
         except json.JSONDecodeError as e:
             raise SerializationError("JSON", f"Invalid JSON format: {e}")
@@ -150,17 +222,28 @@ class JsonItemRepository(ItemRepositoryInterface):
             # Valor por defecto para campos desconocidos
             return ""
     
+    def add_reload_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Registra una función a ejecutar cada vez que se recargan los datos.
+        
+        Args:
+            listener: Función sin argumentos (por ejemplo, invalidar una caché)
+        """
+        self._reload_listeners.append(listener)
+    
     def reload_data(self) -> None:
-        """Recarga los datos desde el archivo."""
+        """Recarga los datos desde el archivo y notifica a los listeners."""
         self._load_data()
+        for listener in self._reload_listeners:
+            listener()
     
     def get_stats(self) -> Dict[str, Any]:
         """Obtiene estadísticas del repositorio."""
         return {
             "total_items": len(self._items),
             "available_items": len([item for item in self._items if item.is_available]),
-            "categories": len(set(item.category_id for item in self._items)),
+            "categories": len(self._items_by_category),
             "brands": len(set(item.get_brand() for item in self._items if item.get_brand())),
             "data_file": str(self._data_file),
-            "last_loaded": "now"  # En una implementación real, esto sería un timestamp
+            "last_loaded": self._loaded_at
         }
@@ -0,0 +1,90 @@
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+
+_TOKEN_SPLIT = re.compile(r"\W+")
+_TRIGRAM_SIZE = 3
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Normaliza un texto a minúsculas y lo divide en tokens alfanuméricos."""
+    if not text:
+        return []
+    return [token for token in _TOKEN_SPLIT.split(text.lower()) if token]
+
+
+def trigrams(token: str) -> Set[str]:
+    """Obtiene los trigramas de un token."""
+    return {token[i:i + _TRIGRAM_SIZE] for i in range(len(token) - _TRIGRAM_SIZE + 1)}
+
+
+class TextSearchIndex:
+    """
+    Índice invertido de texto para búsquedas por término.
+    Mantiene dos estructuras construidas una sola vez al cargar los datos:
+    - Índice invertido: token -> ids de items que lo contienen
+    - Índice de trigramas: trigrama -> ids de items cuyos tokens lo contienen
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+
+    def add(self, item_id: str, texts: Iterable[Optional[str]]) -> None:
+        """
+        Indexa los textos de un item.
+
+        Args:
+            item_id: Identificador del item
+            texts: Textos a indexar (título, marca, modelo)
+        """
+        for text in texts:
+            for token in tokenize(text):
+                self._postings.setdefault(token, set()).add(item_id)
+                for trigram in trigrams(token):
+                    self._trigrams.setdefault(trigram, set()).add(item_id)
+
+    def candidates(self, search_term: str) -> Optional[Set[str]]:
+        """
+        Obtiene los ids candidatos para un término de búsqueda.
+
+        El resultado es un superconjunto de los items que contienen el término
+        como substring, por lo que cada candidato debe verificarse luego con
+        la lógica de dominio (Item.matches_search_term).
+
+        Args:
+            search_term: Término de búsqueda
+
+        Returns:
+            Conjunto de ids candidatos, o None si el término no tiene tokens indexables
+        """
+        tokens = tokenize(search_term)
+        if not tokens:
+            return None
+
+        result: Optional[Set[str]] = None
+        # Tokens largos primero: sus listas suelen ser más cortas y reducen antes la intersección
+        for token in sorted(tokens, key=len, reverse=True):
+            ids = self._candidates_for_token(token)
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result
+
+    def _candidates_for_token(self, token: str) -> Set[str]:
+        """Obtiene los ids de items que contienen el token como substring."""
+        if len(token) >= _TRIGRAM_SIZE:
+            result: Optional[Set[str]] = None
+            for trigram in trigrams(token):
+                ids = self._trigrams.get(trigram)
+                if not ids:
+                    return set()
+                result = set(ids) if result is None else result & ids
+            return result or set()
+
+        # Tokens cortos: se recorre el vocabulario (mucho menor que el catálogo)
+        result = set()
+        for indexed_token, ids in self._postings.items():
+            if token in indexed_token:
+                result |= ids
+        return result
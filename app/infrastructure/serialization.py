@@ -0,0 +1,41 @@
+"""
+Serialización JSON con orjson.
+Centraliza la conversión de los tipos que orjson no serializa de forma nativa.
+Las dataclasses (Money, Item, etc.) las serializa orjson directamente; sus
+campos Decimal pasan por default.
+"""
+
+from decimal import Decimal
+from typing import Any
+import orjson
+
+
+def default(obj: Any) -> Any:
+    """
+    Convierte a tipos JSON los valores que orjson no soporta directamente.
+    
+    Args:
+        obj: Valor a convertir
+        
+    Returns:
+        Valor serializable por orjson
+        
+    Raises:
+        TypeError: Si el tipo no es serializable
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializa un valor a JSON (bytes) con orjson.
+    
+    Args:
+        obj: Valor a serializar
+        
+    Returns:
+        bytes: Documento JSON
+    """
+    return orjson.dumps(obj, default=default)
@@ -69,16 +69,16 @@ class ItemSerializer:
                 currency=data["currency_id"]
             )
             
-            # Crear listas de objetos de valor
-            pictures = [
+            # Crear colecciones de objetos de valor (tuplas: solo se recorren)
+            pictures = tuple(
                 ItemSerializer._convert_picture_from_dict(pic_data) 
-                for pic_data in data.get("pictures", [])
-            ]
+                for pic_data in data.get("pictures") or ()
+            )
             
-            attributes = [
+            attributes = tuple(
                 ItemSerializer._convert_attribute_from_dict(attr_data) 
-                for attr_data in data.get("attributes", [])
-            ]
+                for attr_data in data.get("attributes") or ()
+            )
             
             # Crear objetos opcionales
             shipping = None
@@ -103,7 +103,7 @@ class ItemSerializer:
                 shipping=shipping,
                 seller=seller,
                 warranty=data.get("warranty"),
-                category_path=data.get("category_path", [])
+                category_path=tuple(data.get("category_path") or ())
             )
         except Exception as e:
             raise SerializationError("Item", f"Error deserializing item: {str(e)}")
@@ -1,9 +1,13 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from app.presentation.routers.item_router import router as item_router
+from app.presentation.routers.item_router import make_router, warm_list_cache
+from app.presentation.routers.health_router import health_route
 from app.domain.core.errors import setup_error_handlers
 from app.infrastructure.middleware import SecurityMiddleware
 from app.infrastructure.config.env_config import config
+from app.domain.core.dependencies import get_item_controller, get_response_cache, get_item_json_cache, get_coalescer
 import logging
 
 # Configurar logging
@@ -12,6 +16,17 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Precalienta la caché de listados y el esquema OpenAPI antes de aceptar requests."""
+    await run_in_threadpool(warm_list_cache, app.state.item_controller, get_response_cache())
+    # app.openapi() guarda el esquema en app.openapi_schema: /openapi.json y /docs lo reutilizan
+    if app.openapi_url:
+        await run_in_threadpool(app.openapi)
+    yield
+
+
 # Crear aplicación FastAPI
 app = FastAPI(
     title="MercadoLibre Items API",
@@ -50,8 +65,11 @@ Método 2 - Query Parameter:
 - 403: Permisos insuficientes 
 - 429: Rate limit excedido""",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    lifespan=lifespan,
+    # En producción no se expone ni se genera el esquema OpenAPI
+    openapi_url=None if config.is_production() else "/openapi.json",
+    docs_url=None if config.is_production() else "/docs",
+    redoc_url=None if config.is_production() else "/redoc",
     contact={
         "name": "MercadoLibre Items API",
         "email": "api@mercadolibre.com"
@@ -103,16 +121,30 @@ app.add_middleware(SecurityMiddleware)
 def test_endpoint():
     return {"status": "working", "message": "Server is responding with middleware"}
 
+# Controlador compartido por todos los requests
+app.state.item_controller = get_item_controller()
+
+# Health check como ruta ASGI directa, registrada antes que los routers
+app.router.routes.append(health_route())
+
 # Incluir routers
-app.include_router(item_router)
+app.include_router(make_router(app.state.item_controller, get_response_cache(), get_item_json_cache(), get_coalescer()))
 
 # Configurar manejadores de excepciones
 setup_error_handlers(app)
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=config.APP_PORT)
+    # uvloop no está disponible en Windows; httptools sí
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=config.APP_PORT,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
 
 
 
@@ -0,0 +1,52 @@
+"""
+Agrupación de requests concurrentes idénticos.
+Cuando varios clientes piden el mismo recurso a la vez, solo el primero
+ejecuta el trabajo y el resto espera el mismo resultado.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class Coalescer:
+    """
+    Comparte una única ejecución en curso entre todos los llamadores de una misma clave.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Ejecuta fn una sola vez por clave mientras haya una ejecución en curso.
+
+        Args:
+            key: Clave que identifica el trabajo (ruta y parámetros)
+            fn: Función asíncrona que produce el resultado
+
+        Returns:
+            Resultado de la ejecución compartida
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # shield: si un llamador se cancela, la ejecución compartida continúa para el resto
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """
+        Olvida las ejecuciones en curso.
+
+        Quienes ya esperan reciben igual su resultado; los llamadores nuevos
+        inician una ejecución propia en lugar de compartir una anterior.
+        """
+        self._inflight.clear()
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        """Elimina la ejecución terminada del registro de trabajos en curso."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
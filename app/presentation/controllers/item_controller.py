@@ -3,11 +3,12 @@ Controlador para manejar las operaciones de items.
 Actúa como intermediario entre la capa de presentación y los servicios de dominio.
 """
 
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Tuple
 from app.domain.services.item_service import ItemService
 from app.domain.services.search_service import SearchService
 from app.domain.entities.item import Item
 from app.domain.core.exceptions import ItemNotFoundError
+from app.presentation.schemas.search_params import encode_cursor
 
 
 class ItemController:
@@ -16,7 +17,7 @@ class ItemController:
     y los servicios de dominio.
     """
 
-    def __init__(self, item_service: ItemService, search_service: SearchService):
+    def __init__(self, item_service: ItemService, search_service: SearchService) -> None:
         """
         Inicializa el controlador con los servicios necesarios.
         
@@ -26,6 +27,8 @@ class ItemController:
         """
         self._item_service = item_service
         self._search_service = search_service
+        # Listados por (tipo, límite): solo cambian al recargar el catálogo
+        self._listings: Dict[Tuple[str, int], dict] = {}
 
     def get_item_by_id(self, item_id: str) -> dict:
         """
@@ -43,7 +46,23 @@ class ItemController:
         item = self._item_service.get_item_by_id(item_id)
         return self._convert_item_to_dict(item)
 
-    def search_items(
+    def search_items(self, **criteria: Any) -> dict:
+        """
+        Busca items con criterios específicos y devuelve resultados paginados.
+        
+        Args:
+            **criteria: Mismos parámetros que search_page
+            
+        Returns:
+            dict: Resultado de la búsqueda con datos y metadatos
+        """
+        items, meta = self.search_page(**criteria)
+        return {
+            "data": [self._convert_item_to_dict(item) for item in items],
+            "meta": meta
+        }
+
+    def search_page(
         self,
         query: str = "",
         limit: int = 10,
@@ -54,10 +73,13 @@ class ItemController:
         brand: Optional[str] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
-        available_only: bool = False
-    ) -> dict:
+        available_only: bool = False,
+        cursor: Optional[Tuple[Any, str]] = None
+    ) -> Tuple[List[Item], Dict[str, Any]]:
         """
-        Busca items con criterios específicos y devuelve resultados paginados.
+        Busca items con criterios específicos sin convertirlos a diccionario.
+        
+        Permite a la capa HTTP serializar los items con su propia caché.
         
         Args:
             query: Término de búsqueda
@@ -70,9 +92,11 @@ class ItemController:
             min_price: Precio mínimo
             max_price: Precio máximo
             available_only: Solo items disponibles
+            cursor: Clave decodificada del último item visto (paginación por cursor)
             
         Returns:
-            dict: Resultado de la búsqueda con datos y metadatos
+            Tuple: Items de la página y metadatos de paginación (con cursor,
+                offset es None y no se incluye current_page)
         """
         search_result = self._search_service.search_items(
             query=query,
@@ -84,25 +108,26 @@ class ItemController:
             brand=brand,
             min_price=min_price,
             max_price=max_price,
-            available_only=available_only
+            available_only=available_only,
+            cursor=cursor
         )
         
-        # Convertir items a formato de respuesta
-        items_data = [self._convert_item_to_dict(item) for item in search_result.items]
-        
-        return {
-            "data": items_data,
-            "meta": {
-                "total": search_result.total_count,
-                "limit": limit,
-                "offset": offset,
-                "has_more": search_result.has_more,
-                "current_page": (offset // limit) + 1,
-                "total_pages": (search_result.total_count + limit - 1) // limit
-            }
+        meta = {
+            "total": search_result.total_count,
+            "limit": limit,
+            "offset": offset,
+            "has_more": search_result.has_more,
+            "current_page": (offset // limit) + 1,
+            "total_pages": (search_result.total_count + limit - 1) // limit,
+            "next_cursor": encode_cursor(search_result.next_key) if search_result.next_key else None
         }
+        if cursor is not None:
+            # Con cursor se ignora offset: no se informa una posición que no se usó
+            meta["offset"] = None
+            del meta["current_page"]
+        return search_result.items, meta
 
-    def get_recommendations(self, item_id: str, k: int = 5) -> List[dict]:
+    def get_recommendations(self, item_id: str, k: int = 5) -> dict:
         """
         Obtiene recomendaciones de items similares.
         
@@ -111,12 +136,12 @@ class ItemController:
             k: Número máximo de recomendaciones
             
         Returns:
-            List[dict]: Lista de items recomendados
+            dict: Respuesta con la lista de items recomendados en "data"
         """
         recommendations = self._search_service.get_recommendations(item_id, k)
-        return [self._convert_item_to_dict(item) for item in recommendations]
+        return {"data": [self._convert_item_to_dict(item) for item in recommendations]}
 
-    def get_popular_items(self, limit: int = 10) -> List[dict]:
+    def get_popular_items(self, limit: int = 10) -> dict:
         """
         Obtiene los items más populares basados en cantidad vendida.
         
@@ -124,12 +149,17 @@ class ItemController:
             limit: Número máximo de items a devolver
             
         Returns:
-            List[dict]: Lista de items populares
+            dict: Respuesta con la lista de items populares en "data" (compartida entre llamadas: no modificar)
         """
-        popular_items = self._search_service.get_popular_items(limit)
-        return [self._convert_item_to_dict(item) for item in popular_items]
+        key = ("popular", limit)
+        response = self._listings.get(key)
+        if response is None:
+            popular_items = self._search_service.get_popular_items(limit)
+            response = {"data": [self._convert_item_to_dict(item) for item in popular_items]}
+            self._listings[key] = response
+        return response
 
-    def get_available_items(self, limit: int = 10) -> List[dict]:
+    def get_available_items(self, limit: int = 10) -> dict:
         """
         Obtiene items que están disponibles para compra.
         
@@ -137,10 +167,28 @@ class ItemController:
             limit: Número máximo de items a devolver
             
         Returns:
-            List[dict]: Lista de items disponibles
+            dict: Respuesta con la lista de items disponibles en "data" (compartida entre llamadas: no modificar)
+        """
+        key = ("available", limit)
+        response = self._listings.get(key)
+        if response is None:
+            available_items = self._search_service.get_available_items(limit)
+            response = {"data": [self._convert_item_to_dict(item) for item in available_items]}
+            self._listings[key] = response
+        return response
+
+    def clear_cache(self) -> None:
+        """Descarta los listados memorizados (se invoca al recargar el catálogo)."""
+        self._listings.clear()
+
+    def get_last_modified(self) -> Optional[float]:
+        """
+        Obtiene el momento de la última modificación del catálogo.
+        
+        Returns:
+            Optional[float]: Timestamp (epoch) de la última carga de datos
         """
-        available_items = self._search_service.get_available_items(limit)
-        return [self._convert_item_to_dict(item) for item in available_items]
+        return self._item_service.get_last_modified()
 
     def _convert_item_to_dict(self, item: Item) -> dict:
         """
@@ -0,0 +1,67 @@
+"""
+Utilidades de caché HTTP para los endpoints del catálogo.
+Permite que los navegadores reutilicen respuestas que cambian con poca frecuencia.
+Los endpoints requieren API key, por lo que las respuestas no se marcan como
+públicas: un caché compartido podría entregarlas a clientes sin key.
+"""
+
+import hashlib
+from email.utils import formatdate
+from functools import lru_cache
+from typing import Optional
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, max-age=60"
+VARY = "X-API-Key"
+
+
+@lru_cache(maxsize=8)
+def _http_date(timestamp: float) -> str:
+    """Formatea un timestamp como fecha HTTP (RFC 7231)."""
+    return formatdate(timestamp, usegmt=True)
+
+
+def set_caching_headers(response: Response, last_modified: Optional[float]) -> None:
+    """
+    Agrega los headers Cache-Control, Vary y Last-Modified a la respuesta.
+
+    Args:
+        response: Respuesta a modificar
+        last_modified: Timestamp (epoch) de la última modificación del catálogo
+    """
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["Vary"] = VARY
+    if last_modified:
+        response.headers["Last-Modified"] = _http_date(last_modified)
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Calcula un ETag fuerte a partir del cuerpo de la respuesta.
+
+    Args:
+        body: Cuerpo serializado de la respuesta
+
+    Returns:
+        str: ETag entre comillas
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Verifica si el cliente ya tiene la versión actual del recurso.
+
+    Args:
+        request: Request HTTP con el header If-None-Match opcional
+        etag: ETag actual del recurso
+
+    Returns:
+        bool: True si corresponde responder 304 Not Modified
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
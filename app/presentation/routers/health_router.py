@@ -0,0 +1,44 @@
+"""
+Endpoint de salud servido como aplicación ASGI mínima.
+Evita la validación y serialización de FastAPI en un endpoint consultado
+con alta frecuencia por balanceadores de carga.
+"""
+
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+from app.infrastructure.serialization import dumps
+
+HEALTH_PATH = "/api/v1/health"
+HEALTH_RESPONSE = dumps({"status": "ok"})
+
+_HEALTH_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(HEALTH_RESPONSE)).encode()),
+    # El estado debe consultarse siempre al proceso, nunca a una caché intermedia
+    (b"cache-control", b"no-store"),
+)
+_HEALTH_BODY = {"type": "http.response.body", "body": HEALTH_RESPONSE}
+
+
+class HealthEndpoint:
+    """Aplicación ASGI que responde siempre con el estado precalculado."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Los middlewares pueden agregar headers sobre la lista recibida,
+        # por eso se entrega una copia en cada respuesta
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": list(_HEALTH_HEADERS),
+        })
+        await send(_HEALTH_BODY)
+
+
+def health_route() -> Route:
+    """
+    Crea la ruta de health check.
+
+    Returns:
+        Route de Starlette que delega en HealthEndpoint
+    """
+    return Route(HEALTH_PATH, endpoint=HealthEndpoint(), methods=["GET"])
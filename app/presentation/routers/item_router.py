@@ -3,343 +3,510 @@ Router para endpoints de items.
 Define las rutas HTTP y delega la lógica al controlador.
 """
 
-from fastapi import APIRouter, Query, Path, Depends
-from typing import Optional
+from fastapi import APIRouter, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Tuple
 from app.presentation.controllers.item_controller import ItemController
+from app.domain.entities.item import Item
 from app.domain.core.api_response import ItemResponse, SearchResponse, ItemsResponse
-from app.domain.core.dependencies import get_item_controller
-
-router = APIRouter(prefix="/api/v1")
-
-
-@router.get(
-    "/health",
-    tags=["health"],
-    summary="Verificar el estado del servicio",
-    description="Endpoint de monitoreo que verifica el estado del servicio. Útil para balanceadores de carga y sistemas de monitoreo.",
-    responses={
-        200: {
-            "description": "Servicio funcionando correctamente",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "ok"
+from app.infrastructure.config.env_config import config
+from app.presentation.http_cache import set_caching_headers, compute_etag, is_not_modified
+from app.presentation.coalescer import Coalescer
+from app.infrastructure.cache.response_cache import ResponseCache
+from app.infrastructure.cache.item_json_cache import ItemJsonCache
+from app.infrastructure.serialization import dumps
+from app.presentation.schemas.search_params import (
+    parse_search_params, MAX_LIMIT, MAX_QUERY_LENGTH, SORT_FIELDS, SORT_DIRECTIONS
+)
+
+# Por encima de este límite la búsqueda se envía en partes (un item por chunk)
+STREAMING_MIN_LIMIT = 10
+
+# Límites más usados de los listados, precalculados al iniciar la aplicación
+WARM_LIMITS = (5, 10, 20, 50)
+
+# Documentación OpenAPI de los parámetros de búsqueda, que se leen del query string
+SEARCH_QUERY_PARAMETERS = [
+    {
+        "name": "q", "in": "query", "required": False,
+        "description": "Texto a buscar en título, marca o modelo del producto",
+        "schema": {"type": "string", "default": "", "maxLength": MAX_QUERY_LENGTH}, "example": "iphone"
+    },
+    {
+        "name": "limit", "in": "query", "required": False,
+        "description": "Número máximo de resultados por página (1-100)",
+        "schema": {"type": "integer", "default": 10, "minimum": 1, "maximum": MAX_LIMIT}, "example": 10
+    },
+    {
+        "name": "offset", "in": "query", "required": False,
+        "description": "Número de resultados a saltar para paginación",
+        "schema": {"type": "integer", "default": 0, "minimum": 0}, "example": 0
+    },
+    {
+        "name": "sort_field", "in": "query", "required": False,
+        "description": "Campo de ordenamiento",
+        "schema": {"type": "string", "enum": list(SORT_FIELDS)}, "example": "price"
+    },
+    {
+        "name": "sort_direction", "in": "query", "required": False,
+        "description": "Dirección de ordenamiento",
+        "schema": {"type": "string", "enum": list(SORT_DIRECTIONS), "default": "asc"}, "example": "desc"
+    },
+    {
+        "name": "category_id", "in": "query", "required": False,
+        "description": "ID de categoría para filtrar productos",
+        "schema": {"type": "string"}, "example": "MLA1055"
+    },
+    {
+        "name": "brand", "in": "query", "required": False,
+        "description": "Marca específica para filtrar productos",
+        "schema": {"type": "string"}, "example": "Apple"
+    },
+    {
+        "name": "min_price", "in": "query", "required": False,
+        "description": "Precio mínimo en pesos argentinos",
+        "schema": {"type": "number", "minimum": 0}, "example": 100000.0
+    },
+    {
+        "name": "max_price", "in": "query", "required": False,
+        "description": "Precio máximo en pesos argentinos",
+        "schema": {"type": "number", "minimum": 0}, "example": 500000.0
+    },
+    {
+        "name": "available_only", "in": "query", "required": False,
+        "description": "Si es true, solo devuelve productos con stock disponible",
+        "schema": {"type": "boolean", "default": False}, "example": False
+    },
+    {
+        "name": "cursor", "in": "query", "required": False,
+        "description": "Cursor opaco (meta.next_cursor de la página anterior). Reemplaza a offset para paginar sin saltar resultados",
+        "schema": {"type": "string"}
+    },
+]
+
+
+# Respuestas documentadas en OpenAPI, compartidas entre rutas
+_ERR_400 = {
+    "description": "Criterios de búsqueda inválidos",
+    "content": {
+        "application/json": {
+            "example": {
+                "code": "INVALID_SEARCH_CRITERIA",
+                "message": "Invalid search criteria: limit = 0",
+                "status": 400,
+                "cause": ["Field: limit", "Value: 0", "Reason: Input should be greater than or equal to 1"]
+            }
+        }
+    }
+}
+
+# El manejador de errores de dominio responde ITEM_NOT_FOUND con status 400
+_ERR_ITEM_NOT_FOUND = {
+    "description": "El producto no fue encontrado",
+    "content": {
+        "application/json": {
+            "example": {
+                "code": "ITEM_NOT_FOUND",
+                "message": "Item with id 'MLA999999999' not found",
+                "status": 400,
+                "cause": ["Item ID: MLA999999999"]
+            }
+        }
+    }
+}
+
+_ERR_500 = {
+    "description": "Error interno del servidor",
+    "content": {
+        "application/json": {
+            "example": {
+                "code": "INTERNAL_ERROR",
+                "message": "An unexpected error occurred",
+                "status": 500,
+                "cause": []
+            }
+        }
+    }
+}
+
+_POPULAR_200 = {
+    "model": ItemsResponse,
+    "description": "Lista de productos más populares ordenados por cantidad vendida",
+    "content": {
+        "application/json": {
+            "example": {
+                "data": [
+                    {
+                        "id": "MLA777888999",
+                        "title": "Smartphone Samsung Galaxy A34 128GB",
+                        "category_id": "MLA1055",
+                        "price": 299999.0,
+                        "currency_id": "ARS",
+                        "available_quantity": 25,
+                        "sold_quantity": 980,
+                        "condition": "new"
                     }
-                }
+                ]
             }
         }
     }
-)
-def health():
-    """
-    Endpoint de salud del servicio.
-    
-    Returns:
-        dict: Estado del servicio
-    """
-    return {"status": "ok"}
-
-
-@router.get(
-    "/items/popular",
-    response_model=ItemsResponse,
-    tags=["items"],
-    summary="Obtener productos más populares",
-    description="Devuelve los productos más populares ordenados por cantidad vendida. Útil para mostrar productos destacados y análisis de tendencias.",
-    responses={
-        200: {
-            "description": "Lista de productos más populares ordenados por cantidad vendida",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "data": [
-                            {
-                                "id": "MLA777888999",
-                                "title": "Smartphone Samsung Galaxy A34 128GB",
-                                "category_id": "MLA1055",
-                                "price": 299999.0,
-                                "currency_id": "ARS",
-                                "available_quantity": 25,
-                                "sold_quantity": 980,
-                                "condition": "new"
-                            }
-                        ]
+}
+
+_AVAILABLE_200 = {
+    "model": ItemsResponse,
+    "description": "Lista de productos disponibles para compra",
+    "content": {
+        "application/json": {
+            "example": {
+                "data": [
+                    {
+                        "id": "MLA443322110",
+                        "title": "Mouse Inalámbrico Logitech MX Master 3S",
+                        "category_id": "MLA43156",
+                        "price": 64999.0,
+                        "currency_id": "ARS",
+                        "available_quantity": 40,
+                        "sold_quantity": 1500,
+                        "condition": "new"
                     }
-                }
+                ]
             }
         }
     }
-)
-async def get_popular_items(
-    limit: int = Query(
-        10, 
-        ge=1, 
-        le=50, 
-        description="Número máximo de productos populares a devolver (1-50)",
-        examples=[10]
-    ),
-    controller: ItemController = Depends(get_item_controller)
-) -> ItemsResponse:
+}
+
+_SEARCH_200 = {
+    "model": SearchResponse,
+    "description": "Lista de productos que coinciden con los criterios de búsqueda"
+}
+
+_ITEM_200 = {
+    "model": ItemResponse,
+    "description": "Detalle del producto solicitado"
+}
+
+_RECOMMENDATIONS_200 = {
+    "model": ItemsResponse,
+    "description": "Lista de productos recomendados (vacía si el producto base no existe)"
+}
+
+
+def _route_docs(**docs: Any) -> Dict[str, Any]:
     """
-    Obtiene los productos más populares basados en cantidad vendida.
+    Devuelve los argumentos de documentación OpenAPI de una ruta.
+    
+    En producción se descartan (summary, description, responses) para no
+    construir ni retener los ejemplos, ya que la documentación está deshabilitada.
     
     Args:
-        limit: Número máximo de productos populares (1-50)
-        controller: Controlador de items inyectado
+        **docs: Argumentos de documentación del decorador
         
     Returns:
-        ItemsResponse: Lista de productos populares ordenados por cantidad vendida
-        
-    Raises:
-        500: Error interno del servidor
+        dict: Argumentos a expandir en el decorador de la ruta
     """
-    return {"data": controller.get_popular_items(limit)}
-
-
-@router.get(
-    "/items/available",
-    response_model=ItemsResponse,
-    tags=["items"],
-    summary="Obtener productos disponibles",
-    description="Devuelve productos con stock disponible (quantity > 0) ordenados por cantidad disponible. Útil para filtros de disponibilidad inmediata.",
-    responses={
-        200: {
-            "description": "Lista de productos disponibles para compra",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "data": [
-                            {
-                                "id": "MLA443322110",
-                                "title": "Mouse Inalámbrico Logitech MX Master 3S",
-                                "category_id": "MLA43156",
-                                "price": 64999.0,
-                                "currency_id": "ARS",
-                                "available_quantity": 40,
-                                "sold_quantity": 1500,
-                                "condition": "new"
-                            }
-                        ]
-                    }
-                }
-            }
-        }
-    }
-)
-async def get_available_items(
-    limit: int = Query(
-        10, 
-        ge=1, 
-        le=50, 
-        description="Número máximo de productos disponibles a devolver (1-50)",
-        examples=[10]
-    ),
-    controller: ItemController = Depends(get_item_controller)
-) -> ItemsResponse:
+    return {} if config.is_production() else docs
+
+
+def _render(produce: Callable[[], Any]) -> Tuple[str, bytes]:
     """
-    Obtiene productos que están disponibles para compra (con stock > 0).
+    Ejecuta el controlador y serializa su resultado a JSON.
     
     Args:
-        limit: Número máximo de productos disponibles (1-50)
-        controller: Controlador de items inyectado
+        produce: Función que obtiene la respuesta del controlador
         
     Returns:
-        ItemsResponse: Lista de productos disponibles ordenados por cantidad de stock
-        
-    Raises:
-        500: Error interno del servidor
-    """
-    return {"data": controller.get_available_items(limit)}
-
-
-@router.get(
-    "/items",
-    response_model=SearchResponse,
-    tags=["search"],
-    summary="Búsqueda avanzada de productos",
-    description="Búsqueda de productos con múltiples filtros: texto, categoría, marca, precio y disponibilidad. Incluye ordenamiento y paginación.",
-    responses={
-        200: {
-            "description": "Lista de productos que coinciden con los criterios de búsqueda"
-        },
-        400: {
-            "description": "Criterios de búsqueda inválidos"
-        }
-    }
-)
-async def search_items(
-    q: str = Query(
-        "", 
-        description="Texto a buscar en título, marca o modelo del producto",
-        examples=["iphone"],
-        max_length=100
-    ),
-    limit: int = Query(
-        10, 
-        ge=1, 
-        le=100, 
-        description="Número máximo de resultados por página (1-100)",
-        examples=[10]
-    ),
-    offset: int = Query(
-        0, 
-        ge=0, 
-        description="Número de resultados a saltar para paginación",
-        examples=[0]
-    ),
-    sort_field: Optional[str] = Query(
-        None, 
-        description="Campo de ordenamiento",
-        examples=["price"]
-    ),
-    sort_direction: str = Query(
-        "asc", 
-        description="Dirección de ordenamiento",
-        examples=["desc"],
-        pattern="^(asc|desc)$"
-    ),
-    category_id: Optional[str] = Query(
-        None, 
-        description="ID de categoría para filtrar productos",
-        examples=["MLA1055"]
-    ),
-    brand: Optional[str] = Query(
-        None, 
-        description="Marca específica para filtrar productos",
-        examples=["Apple"]
-    ),
-    min_price: Optional[float] = Query(
-        None, 
-        ge=0, 
-        description="Precio mínimo en pesos argentinos",
-        examples=[100000.0]
-    ),
-    max_price: Optional[float] = Query(
-        None, 
-        ge=0, 
-        description="Precio máximo en pesos argentinos",
-        examples=[500000.0]
-    ),
-    available_only: bool = Query(
-        False, 
-        description="Si es true, solo devuelve productos con stock disponible",
-        examples=[False]
-    ),
-    controller: ItemController = Depends(get_item_controller)
-) -> SearchResponse:
-    """
-    Busca productos con criterios específicos y devuelve resultados paginados.
+        Tuple: ETag y cuerpo serializado, que se cachean juntos para no recalcular el hash
     """
-    return controller.search_items(
-        query=q,
-        limit=limit,
-        offset=offset,
-        sort_field=sort_field,
-        sort_direction=sort_direction,
-        category_id=category_id,
-        brand=brand,
-        min_price=min_price,
-        max_price=max_price,
-        available_only=available_only
-    )
+    body = dumps(produce())
+    return compute_etag(body), body
 
 
-@router.get(
-    "/items/{item_id}",
-    response_model=ItemResponse,
-    tags=["items"],
-    summary="Obtener detalle completo de producto",
-    description="Devuelve información completa de un producto: título, precio, imágenes, atributos, envío, vendedor y garantía.",
-    responses={
-        200: {
-            "description": "Detalle del producto solicitado"
-        },
-        404: {
-            "description": "El producto no fue encontrado",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "code": "ITEM_NOT_FOUND",
-                        "message": "Item with id 'MLA999999999' not found",
-                        "status": 404,
-                        "cause": ["Item ID: MLA999999999"]
-                    }
-                }
-            }
-        }
-    }
-)
-async def get_item(
-    item_id: str = Path(
-        ..., 
-        description="Identificador único del producto (formato: MLA + números)",
-        examples=["MLA111222333"],
-        min_length=1,
-        max_length=20
-    ),
-    controller: ItemController = Depends(get_item_controller)
-) -> ItemResponse:
+def _render_search_page(items: List[Item], meta: Dict[str, Any], item_json: ItemJsonCache) -> bytes:
     """
-    Obtiene el detalle completo de un producto específico.
+    Serializa una página de búsqueda reutilizando el JSON ya calculado de cada item.
     
     Args:
-        item_id: Identificador único del producto
-        controller: Controlador de items inyectado
+        items: Items de la página
+        meta: Metadatos de paginación
+        item_json: Caché del JSON de cada item
         
     Returns:
-        ItemResponse: Respuesta con el detalle del producto
+        bytes: Documento JSON con las claves "data" y "meta"
+    """
+    return b'{"data":' + item_json.encode_list(items) + b',"meta":' + dumps(meta) + b"}"
+
+
+async def _stream_search_page(items: List[Item], meta: Dict[str, Any], item_json: ItemJsonCache) -> AsyncIterator[bytes]:
+    """
+    Serializa la página de búsqueda item por item.
+    
+    Args:
+        items: Items de la página
+        meta: Metadatos de paginación
+        item_json: Caché del JSON de cada item
         
-    Raises:
-        404: Producto no encontrado
-        400: Parámetros inválidos
-        500: Error interno del servidor
+    Yields:
+        bytes: Partes del documento JSON
     """
-    return controller.get_item_by_id(item_id)
-
-
-@router.get(
-    "/items/{item_id}/recommendations",
-    response_model=ItemsResponse,
-    tags=["recommendations"],
-    summary="Obtener productos recomendados",
-    description="Sistema de recomendaciones basado en similitud: marca, categoría, precio y popularidad. Algoritmo de puntuación por características similares.",
-    responses={
-        200: {
-            "description": "Lista de productos recomendados"
-        },
-        404: {
-            "description": "El producto base no fue encontrado"
-        }
-    }
-)
-async def get_recommendations(
-    item_id: str = Path(
-        ..., 
-        description="ID del producto base para generar recomendaciones",
-        examples=["MLA111222333"]
-    ),
-    k: int = Query(
-        5, 
-        ge=1, 
-        le=20, 
-        description="Número máximo de recomendaciones a devolver (1-20)",
-        examples=[5]
-    ),
-    controller: ItemController = Depends(get_item_controller)
-) -> ItemsResponse:
+    yield b'{"data":['
+    for index, item in enumerate(items):
+        yield (b"," if index else b"") + item_json.encode(item)
+    yield b'],"meta":' + dumps(meta) + b"}"
+
+
+def warm_list_cache(controller: ItemController, cache: ResponseCache) -> None:
     """
-    Obtiene recomendaciones de productos similares basados en un producto específico.
+    Precarga en la caché los listados de populares y disponibles.
+    
+    Usa los mismos espacios de nombres y claves que los endpoints, por lo que
+    el primer request con un límite habitual ya encuentra la respuesta lista.
     
     Args:
-        item_id: ID del producto base para generar recomendaciones
-        k: Número máximo de recomendaciones (1-20)
-        controller: Controlador de items inyectado
+        controller: Controlador de items
+        cache: Caché de respuestas compartida con el router
+    """
+    generation = controller.get_last_modified()
+    for limit in WARM_LIMITS:
+        cache.set("popular", (limit, generation), _render(lambda: controller.get_popular_items(limit)))
+        cache.set("available", (limit, generation), _render(lambda: controller.get_available_items(limit)))
+
+
+def make_router(
+    controller: ItemController,
+    cache: ResponseCache,
+    item_json: ItemJsonCache,
+    coalescer: Coalescer
+) -> APIRouter:
+    """
+    Crea el router de items con el controlador capturado por closure.
+    
+    Args:
+        controller: Controlador de items compartido por todos los endpoints
+        cache: Caché de respuestas serializadas
+        item_json: Caché del JSON de cada item usada por la búsqueda; debe
+            limpiarse cuando el repositorio recarga los datos
+        coalescer: Agrupador de requests concurrentes; debe limpiarse cuando
+            el repositorio recarga los datos
         
     Returns:
-        ItemsResponse: Lista de productos recomendados ordenados por similitud
-        
-    Raises:
-        404: Producto base no encontrado
-        500: Error interno del servidor
+        APIRouter con los endpoints de items registrados
     """
-    return {"data": controller.get_recommendations(item_id, k)}
+    router = APIRouter(prefix="/api/v1", default_response_class=ORJSONResponse)
+
+    async def cached_entry(namespace: str, key: Hashable, produce: Callable[[], Any]) -> Tuple[str, bytes]:
+        """
+        Devuelve el ETag y el cuerpo JSON cacheados o los calcula una sola vez por clave.
+        
+        La clave se arma solo con los parámetros de la ruta (nunca con headers),
+        por lo que una misma entrada es válida para cualquier cliente. Incluye
+        además la carga del catálogo: si el repositorio se recarga mientras se
+        calcula la respuesta, la entrada queda bajo una clave que ya no se consulta.
+        """
+        key = (key, controller.get_last_modified())
+        entry = cache.get(namespace, key)
+        if entry is None:
+            entry = await coalescer.run(
+                (namespace, key),
+                lambda: run_in_threadpool(_render, produce)
+            )
+            cache.set(namespace, key, entry)
+        return entry
+
+    def json_response(request: Request, entry: Tuple[str, bytes]) -> Response:
+        """Crea la respuesta JSON con ETag y headers de caché, o 304 si el cliente ya la tiene."""
+        etag, body = entry
+        if is_not_modified(request, etag):
+            response = Response(status_code=304, headers={"ETag": etag})
+        else:
+            response = Response(content=body, media_type="application/json", headers={"ETag": etag})
+        set_caching_headers(response, controller.get_last_modified())
+        return response
+
+    @router.get(
+        "/items/popular",
+        response_model=None,
+        tags=["items"],
+        **_route_docs(
+            summary="Obtener productos más populares",
+            description="Devuelve los productos más populares ordenados por cantidad vendida. Útil para mostrar productos destacados y análisis de tendencias.",
+            responses={200: _POPULAR_200, 500: _ERR_500}
+        )
+    )
+    async def get_popular_items(
+        request: Request,
+        limit: int = Query(
+            10, 
+            ge=1, 
+            le=50, 
+            description="Número máximo de productos populares a devolver (1-50)",
+            examples=[10]
+        )
+    ) -> Response:
+        """
+        Obtiene los productos más populares basados en cantidad vendida.
+
+        Args:
+            limit: Número máximo de productos populares (1-50)
+
+        Returns:
+            ItemsResponse: Lista de productos populares ordenados por cantidad vendida
+
+        Raises:
+            500: Error interno del servidor
+        """
+        entry = await cached_entry("popular", limit, lambda: controller.get_popular_items(limit))
+        return json_response(request, entry)
+
+
+    @router.get(
+        "/items/available",
+        response_model=None,
+        tags=["items"],
+        **_route_docs(
+            summary="Obtener productos disponibles",
+            description="Devuelve productos con stock disponible (quantity > 0) ordenados por cantidad disponible. Útil para filtros de disponibilidad inmediata.",
+            responses={200: _AVAILABLE_200, 500: _ERR_500}
+        )
+    )
+    async def get_available_items(
+        request: Request,
+        limit: int = Query(
+            10, 
+            ge=1, 
+            le=50, 
+            description="Número máximo de productos disponibles a devolver (1-50)",
+            examples=[10]
+        )
+    ) -> Response:
+        """
+        Obtiene productos que están disponibles para compra (con stock > 0).
+
+        Args:
+            limit: Número máximo de productos disponibles (1-50)
+
+        Returns:
+            ItemsResponse: Lista de productos disponibles ordenados por cantidad de stock
+
+        Raises:
+            500: Error interno del servidor
+        """
+        entry = await cached_entry("available", limit, lambda: controller.get_available_items(limit))
+        return json_response(request, entry)
+
+
+    @router.get(
+        "/items",
+        response_model=None,
+        tags=["search"],
+        **_route_docs(
+            summary="Búsqueda avanzada de productos",
+            description="Búsqueda de productos con múltiples filtros: texto, categoría, marca, precio y disponibilidad. Incluye ordenamiento y paginación.",
+            responses={200: _SEARCH_200, 400: _ERR_400, 500: _ERR_500},
+            openapi_extra={"parameters": SEARCH_QUERY_PARAMETERS}
+        )
+    )
+    async def search_items(request: Request) -> Response:
+        """
+        Busca productos con criterios específicos y devuelve resultados paginados.
+        
+        Los parámetros se leen directamente del query string (ver SEARCH_QUERY_PARAMETERS).
+        Cada item se serializa una sola vez por carga del catálogo y la respuesta
+        se arma concatenando esos cuerpos, sin pasar por jsonable_encoder. Las páginas
+        grandes se envían en partes para que el cliente reciba los primeros bytes antes.
+        """
+        params = parse_search_params(request.scope["query_string"])
+        criteria = params.model_dump()
+        # Búsquedas idénticas concurrentes comparten una sola ejecución (no se cachean)
+        items, meta = await coalescer.run(
+            ("search", tuple(criteria.values())),
+            lambda: run_in_threadpool(controller.search_page, **criteria)
+        )
+        if params.limit > STREAMING_MIN_LIMIT:
+            return StreamingResponse(_stream_search_page(items, meta, item_json), media_type="application/json")
+        return Response(content=_render_search_page(items, meta, item_json), media_type="application/json")
+
+
+    @router.get(
+        "/items/{item_id}",
+        response_model=None,
+        tags=["items"],
+        **_route_docs(
+            summary="Obtener detalle completo de producto",
+            description="Devuelve información completa de un producto: título, precio, imágenes, atributos, envío, vendedor y garantía.",
+            responses={200: _ITEM_200, 400: _ERR_ITEM_NOT_FOUND, 500: _ERR_500}
+        )
+    )
+    async def get_item(
+        request: Request,
+        item_id: str = Path(
+            ..., 
+            description="Identificador único del producto (formato: MLA + números)",
+            examples=["MLA111222333"],
+            min_length=1,
+            max_length=20
+        )
+    ) -> Response:
+        """
+        Obtiene el detalle completo de un producto específico.
+
+        Args:
+            item_id: Identificador único del producto
+
+        Returns:
+            Response: Detalle del producto con ETag, o 304 si el cliente ya tiene la versión actual
+
+        Raises:
+            400: Producto no encontrado (ITEM_NOT_FOUND) o parámetros inválidos
+            500: Error interno del servidor
+        """
+        entry = await cached_entry("item", item_id, lambda: controller.get_item_by_id(item_id))
+        return json_response(request, entry)
+
+
+    @router.get(
+        "/items/{item_id}/recommendations",
+        response_model=None,
+        tags=["recommendations"],
+        **_route_docs(
+            summary="Obtener productos recomendados",
+            description="Sistema de recomendaciones basado en similitud: marca, categoría, precio y popularidad. Algoritmo de puntuación por características similares.",
+            responses={200: _RECOMMENDATIONS_200, 500: _ERR_500}
+        )
+    )
+    async def get_recommendations(
+        request: Request,
+        item_id: str = Path(
+            ..., 
+            description="ID del producto base para generar recomendaciones",
+            examples=["MLA111222333"]
+        ),
+        k: int = Query(
+            5, 
+            ge=1, 
+            le=20, 
+            description="Número máximo de recomendaciones a devolver (1-20)",
+            examples=[5]
+        )
+    ) -> Response:
+        """
+        Obtiene recomendaciones de productos similares basados en un producto específico.
+
+        Args:
+            item_id: ID del producto base para generar recomendaciones
+            k: Número máximo de recomendaciones (1-20)
+
+        Returns:
+            ItemsResponse: Lista de productos recomendados ordenados por similitud
+                (vacía si el producto base no existe)
+
+        Raises:
+            500: Error interno del servidor
+        """
+        entry = await cached_entry(
+            "recommendations", (item_id, k),
+            lambda: controller.get_recommendations(item_id, k)
+        )
+        return json_response(request, entry)
+
+    return router
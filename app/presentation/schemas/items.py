@@ -1,97 +1,123 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
-
-
-class Seller(BaseModel):
-    id: str = Field(..., description="Identificador del vendedor.", example="SELLER001")
-    nickname: Optional[str] = Field(
-        None, description="Alias público del vendedor.", example="TechStore"
-    )
-
-
-class Shipping(BaseModel):
-    free_shipping: bool = Field(
-        ..., description="Indica si el envío es gratuito.", example=True
-    )
-    mode: str = Field(
-        ..., description="Modo de envío (p. ej., 'me2' para Mercado Envíos).", example="me2"
-    )
-    logistic_type: str = Field(
-        ..., description="Tipo de logística (p. ej., 'drop_off', 'cross_docking').", example="drop_off"
-    )
-    store_pick_up: bool = Field(
-        ..., description="Indica si permite retiro en tienda.", example=False
-    )
-
-
-class Picture(BaseModel):
-    id: str = Field(..., description="ID de la imagen.", example="624029-MLA31151332127_062019")
-    url: str = Field(..., description="URL de la imagen.", example="http://http2.mlstatic.com/D_...-O.jpg")
-    secure_url: Optional[str] = Field(
-        None, description="URL segura (https) de la imagen.", example="https://http2.mlstatic.com/D_...-O.jpg"
-    )
-    size: Optional[str] = Field(None, description="Tamaño (p. ej., '500x500').", example="500x500")
-    max_size: Optional[str] = Field(None, description="Tamaño máximo disponible.", example="1200x1200")
-    quality: Optional[str] = Field(None, description="Calidad de la imagen.", example="")
-
-
-class Attribute(BaseModel):
-    id: str = Field(..., description="ID del atributo.", example="BRAND")
-    name: str = Field(..., description="Nombre del atributo.", example="Marca")
-    value_id: Optional[str] = Field(None, description="ID del valor (si es predefinido).", example="9344")
-    value_name: Optional[str] = Field(None, description="Valor legible del atributo.", example="Apple")
-    value_struct: Optional[dict] = Field(
-        None, description="Valor estructurado (p. ej., unidades).", example=None
-    )
-    attribute_group_id: Optional[str] = Field(
-        None, description="ID del grupo de atributos.", example="OTHERS"
-    )
-    attribute_group_name: Optional[str] = Field(
-        None, description="Nombre del grupo de atributos.", example="Otros"
-    )
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, List, Optional, Tuple
+from typing_extensions import NotRequired, TypedDict
+
+
+# Ejemplos para la documentación OpenAPI: un único dict por modelo,
+# en lugar de un example por campo
+ITEM_EXAMPLE = {
+    "id": "MLA123456789",
+    "title": "Apple iPhone 11 64GB Black",
+    "category_id": "MLA1055",
+    "price": 69999.99,
+    "currency_id": "ARS",
+    "available_quantity": 10,
+    "sold_quantity": 5,
+    "condition": "new",
+    "permalink": "https://articulo.mercadolibre.com.ar/MLA-123456789",
+    "pictures": [
+        {
+            "id": "624029-MLA31151332127_062019",
+            "url": "http://http2.mlstatic.com/D_...-O.jpg",
+            "secure_url": "https://http2.mlstatic.com/D_...-O.jpg",
+            "size": "500x500",
+            "max_size": "1200x1200",
+            "quality": ""
+        }
+    ],
+    "shipping": {"free_shipping": True, "mode": "me2", "logistic_type": "drop_off", "store_pick_up": False},
+    "attributes": [
+        {"id": "BRAND", "name": "Marca", "value_id": "9344", "value_name": "Apple", "attribute_group_id": "OTHERS", "attribute_group_name": "Otros"}
+    ],
+    "seller": {"id": "SELLER001", "nickname": "TechStore"},
+    "warranty": "12 meses",
+    "category_path": ["Electrónica", "Audio", "Auriculares"]
+}
+
+PAGE_META_EXAMPLE = {"total": 123, "limit": 10, "offset": 0}
+
+
+# Submodelos de solo lectura: se declaran como TypedDict para no generar un
+# validador y un serializador propios por cada uno
+class Seller(TypedDict):
+    id: Annotated[str, Field(description="Identificador del vendedor.")]
+    nickname: NotRequired[Annotated[Optional[str], Field(description="Alias público del vendedor.")]]
+
+
+class Shipping(TypedDict):
+    free_shipping: Annotated[bool, Field(description="Indica si el envío es gratuito.")]
+    mode: Annotated[str, Field(description="Modo de envío (p. ej., 'me2' para Mercado Envíos).")]
+    logistic_type: Annotated[str, Field(description="Tipo de logística (p. ej., 'drop_off', 'cross_docking').")]
+    store_pick_up: Annotated[bool, Field(description="Indica si permite retiro en tienda.")]
+
+
+class Picture(TypedDict):
+    id: Annotated[str, Field(description="ID de la imagen.")]
+    url: Annotated[str, Field(description="URL de la imagen.")]
+    secure_url: NotRequired[Annotated[Optional[str], Field(description="URL segura (https) de la imagen.")]]
+    size: NotRequired[Annotated[Optional[str], Field(description="Tamaño (p. ej., '500x500').")]]
+    max_size: NotRequired[Annotated[Optional[str], Field(description="Tamaño máximo disponible.")]]
+    quality: NotRequired[Annotated[Optional[str], Field(description="Calidad de la imagen.")]]
+
+
+class ValueStruct(TypedDict):
+    number: NotRequired[Annotated[Optional[float], Field(description="Valor numérico.")]]
+    unit: NotRequired[Annotated[Optional[str], Field(description="Unidad del valor (p. ej., 'GB', 'mAh').")]]
+
+
+class Attribute(TypedDict):
+    id: Annotated[str, Field(description="ID del atributo.")]
+    name: Annotated[str, Field(description="Nombre del atributo.")]
+    value_id: NotRequired[Annotated[Optional[str], Field(description="ID del valor (si es predefinido).")]]
+    value_name: NotRequired[Annotated[Optional[str], Field(description="Valor legible del atributo.")]]
+    value_struct: NotRequired[Annotated[Optional[ValueStruct], Field(description="Valor estructurado (p. ej., unidades).")]]
+    attribute_group_id: NotRequired[Annotated[Optional[str], Field(description="ID del grupo de atributos.")]]
+    attribute_group_name: NotRequired[Annotated[Optional[str], Field(description="Nombre del grupo de atributos.")]]
 
 
 class Item(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"example": ITEM_EXAMPLE})
+
     # Identidad / básicos
     id: str = Field(
-        ..., description="Identificador único del producto (item ID).", example="MLA123456789"
+        ..., description="Identificador único del producto (item ID)."
     )
-    title: str = Field(..., description="Título o nombre del producto.", example="Apple iPhone 11 64GB Black")
-    category_id: str = Field(..., description="ID de la categoría del producto.", example="MLA1055")
+    title: str = Field(..., description="Título o nombre del producto.")
+    category_id: str = Field(..., description="ID de la categoría del producto.")
 
     # Precio / stock
     price: float = Field(
-        ..., ge=0, description="Precio del producto.", example=69999.99
+        ..., ge=0, description="Precio del producto."
     )
     currency_id: str = Field(
-        ..., description="Moneda del precio (ISO).", example="ARS"
+        ..., description="Moneda del precio (ISO)."
     )
     available_quantity: int = Field(
-        ..., ge=0, description="Cantidad disponible en stock.", example=10
+        ..., ge=0, description="Cantidad disponible en stock."
     )
     sold_quantity: int = Field(
-        ..., ge=0, description="Cantidad vendida.", example=5
+        ..., ge=0, description="Cantidad vendida."
     )
 
     # Estado / enlaces
     condition: str = Field(
-        ..., description="Condición (new, used, etc.).", example="new"
+        ..., description="Condición (new, used, etc.)."
     )
     permalink: str = Field(
-        ..., description="URL pública del producto.", example="https://articulo.mercadolibre.com.ar/MLA-123456789"
+        ..., description="URL pública del producto."
     )
 
     # Media
-    pictures: List[Picture] = Field(
-        default_factory=list, description="Lista de imágenes del producto."
+    pictures: Tuple[Picture, ...] = Field(
+        default_factory=tuple, description="Lista de imágenes del producto."
     )
 
     # Envío / atributos
     shipping: Optional[Shipping] = Field(
         None, description="Información de envío (si aplica)."
     )
-    attributes: List[Attribute] = Field(
-        default_factory=list, description="Atributos del producto (marca, modelo, color, etc.)."
+    attributes: Tuple[Attribute, ...] = Field(
+        default_factory=tuple, description="Atributos del producto (marca, modelo, color, etc.)."
     )
 
     # Vendedor / garantías / taxonomía extendida
@@ -99,20 +125,21 @@ class Item(BaseModel):
         None, description="Información del vendedor."
     )
     warranty: Optional[str] = Field(
-        None, description="Información de garantía.", example="12 meses"
+        None, description="Información de garantía."
     )
-    category_path: List[str] = Field(
-        default_factory=list, description="Ruta de categorías (breadcrumbs).", example=["Electrónica", "Audio", "Auriculares"]
+    category_path: Tuple[str, ...] = Field(
+        default_factory=tuple, description="Ruta de categorías (breadcrumbs)."
     )
 
 
 class PageMeta(BaseModel):
-    total: int = Field(..., ge=0, description="Total de resultados.", example=123)
-    limit: int = Field(..., ge=1, description="Límite por página.", example=10)
-    offset: int = Field(..., ge=0, description="Desplazamiento (inicio).", example=0)
+    model_config = ConfigDict(json_schema_extra={"example": PAGE_META_EXAMPLE})
+
+    total: int = Field(..., ge=0, description="Total de resultados.")
+    limit: int = Field(..., ge=1, description="Límite por página.")
+    offset: int = Field(..., ge=0, description="Desplazamiento (inicio).")
 
 
 class ItemListResponse(BaseModel):
     data: List[Item] = Field(..., description="Listado de productos.")
     meta: PageMeta = Field(..., description="Metadatos de paginación.")
-    
\ No newline at end of file
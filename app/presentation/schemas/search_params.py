@@ -0,0 +1,105 @@
+"""
+Parámetros de búsqueda de items leídos directamente del query string.
+Se validan en una sola pasada con un modelo Pydantic, sin construir un
+descriptor Query por parámetro en cada request.
+"""
+
+import base64
+import binascii
+import orjson
+from typing import Any, Literal, Optional, Tuple, Union, get_args
+from urllib.parse import parse_qsl
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from app.domain.core.exceptions import InvalidSearchCriteriaError
+
+SortField = Literal["price", "title", "available_quantity", "sold_quantity", "brand"]
+SortDirection = Literal["asc", "desc"]
+CursorValue = Optional[Union[str, int, float]]
+
+SORT_FIELDS = get_args(SortField)
+SORT_DIRECTIONS = get_args(SortDirection)
+MAX_QUERY_LENGTH = 100
+MAX_LIMIT = 100
+
+
+class SearchParams(BaseModel):
+    """Parámetros validados de búsqueda, con los nombres que espera el controlador."""
+    query: str = Field("", alias="q", max_length=MAX_QUERY_LENGTH)
+    limit: int = Field(10, ge=1, le=MAX_LIMIT)
+    offset: int = Field(0, ge=0)
+    sort_field: Optional[SortField] = None
+    sort_direction: SortDirection = "asc"
+    category_id: Optional[str] = None
+    brand: Optional[str] = None
+    min_price: Optional[float] = Field(None, ge=0)
+    max_price: Optional[float] = Field(None, ge=0)
+    available_only: bool = False
+    cursor: Optional[Tuple[CursorValue, str]] = None
+    
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def _decode_cursor(cls, value: Any) -> Any:
+        """Decodifica el cursor opaco recibido en el query string."""
+        return decode_cursor(value) if isinstance(value, str) else value
+
+
+def encode_cursor(key: Tuple[Any, str]) -> str:
+    """
+    Codifica la clave (valor de orden, id) del último item como cursor opaco.
+
+    Args:
+        key: Clave de orden del último item de la página
+
+    Returns:
+        str: Cursor en base64 apto para URLs
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(list(key))).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[CursorValue, str]:
+    """
+    Decodifica un cursor generado por encode_cursor.
+
+    Args:
+        cursor: Cursor recibido en el query string
+
+    Returns:
+        Tuple: Clave (valor de orden, id) del último item visto
+
+    Raises:
+        InvalidSearchCriteriaError: Si el cursor no es válido
+    """
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error, orjson.JSONDecodeError):
+        key = None
+    # Solo claves escalares: el cursor forma parte de la clave (hashable) del coalescer
+    if not (
+        isinstance(key, list) and len(key) == 2
+        and isinstance(key[0], (str, int, float, type(None)))
+        and isinstance(key[1], str)
+    ):
+        raise InvalidSearchCriteriaError("cursor", cursor, "Must be a cursor returned by a previous page")
+    return key[0], key[1]
+
+
+def parse_search_params(query_string: bytes) -> SearchParams:
+    """
+    Lee y valida los parámetros de búsqueda del query string crudo.
+
+    Args:
+        query_string: Query string del scope ASGI (bytes sin decodificar)
+
+    Returns:
+        SearchParams: Parámetros de búsqueda validados
+
+    Raises:
+        InvalidSearchCriteriaError: Si algún parámetro es inválido
+    """
+    raw = dict(parse_qsl(query_string.decode("latin-1")))
+    try:
+        return SearchParams.model_validate(raw)
+    except ValidationError as exc:
+        error = exc.errors()[0]
+        field = str(error["loc"][0]) if error["loc"] else "query"
+        raise InvalidSearchCriteriaError(field, str(raw.get(field, "")), error["msg"])
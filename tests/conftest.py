@@ -1,19 +1,29 @@
 import pytest
+from fastapi.testclient import TestClient
 from app.domain.services.search_service import SearchService
 from app.domain.services.item_service import ItemService
 from app.infrastructure.repositories.json_item_repository import JsonItemRepository
+from app.main import app
+
+@pytest.fixture(scope="session")
+def _repo():
+    # Los tests no modifican el catálogo: se carga una sola vez por sesión
+    return JsonItemRepository()
 
 @pytest.fixture
-def search_service():
-    repo = JsonItemRepository()
-    return SearchService(repo)
+def search_service(_repo):
+    return SearchService(_repo)
 
 @pytest.fixture
-def item_service():
-    repo = JsonItemRepository()
-    return ItemService(repo)
+def item_service(_repo):
+    return ItemService(_repo)
 
 @pytest.fixture
-def sample_items_list():
-    repo = JsonItemRepository()
-    return repo.find_all()
\ No newline at end of file
+def sample_items_list(_repo):
+    return _repo.find_all()
+
+@pytest.fixture(scope="session")
+def client():
+    # Un único cliente por sesión: el lifespan (que también genera el esquema OpenAPI) corre una vez
+    with TestClient(app) as test_client:
+        yield test_client
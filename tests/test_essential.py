@@ -3,16 +3,32 @@ Tests esenciales - Solo los más importantes para el proyecto
 Mantiene únicamente tests críticos que deben pasar siempre.
 """
 
+import asyncio
+import json
 import pytest
 from decimal import Decimal
-from fastapi.testclient import TestClient
 from unittest.mock import Mock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from app.domain.entities.item import Item, Money
 from app.domain.core.exceptions import ItemNotFoundError
 from app.domain.services.item_service import ItemService
+from app.domain.services.search_service import SearchService
 from app.infrastructure.repositories.json_item_repository import JsonItemRepository
-from app.main import app
+from app.presentation.controllers.item_controller import ItemController
+from app.presentation.coalescer import Coalescer
+from app.presentation.routers.item_router import make_router
+from app.infrastructure.cache.response_cache import ResponseCache
+from app.infrastructure.cache.item_json_cache import ItemJsonCache
+from app.infrastructure import serialization
+from app.infrastructure.serialization import dumps
+
+
+@pytest.fixture(scope="module")
+def repo():
+    """Repositorio compartido por los tests de solo lectura del módulo."""
+    return JsonItemRepository()
 
 
 class TestDomainCore:
@@ -74,6 +90,20 @@ class TestDomainCore:
         assert item_dict["currency_id"] == "ARS"
         assert item_dict["available_quantity"] == 10
     
+    def test_serialization_default(self):
+        """Test serialización JSON - Decimal pasa por default y se convierte a número."""
+        assert serialization.default(Decimal("10.5")) == 10.5
+        with pytest.raises(TypeError):
+            serialization.default(object())
+        
+        # orjson serializa Money como dataclass; solo su Decimal llega a default
+        price = Money(amount=Decimal("1500.50"), currency="ARS")
+        assert dumps({"amount": Decimal("10.5"), "price": price}) == (
+            b'{"amount":10.5,"price":{"amount":1500.5,"currency":"ARS"}}'
+        )
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+    
     def test_item_not_found_exception(self):
         """Test excepción crítica para manejo de errores."""
         exc = ItemNotFoundError("MLA999999999")
@@ -120,37 +150,264 @@ class TestServices:
             service.get_item_by_id("MLA999999999")
         
         assert exc_info.value.item_id == "MLA999999999"
+    
+    def test_search_service_unknown_category_short_circuits(self):
+        """Test filtros inexistentes - no deben recorrer el repositorio."""
+        mock_repo = Mock()
+        mock_repo.has_category.return_value = False
+        
+        service = SearchService(mock_repo)
+        result = service.search_items(category_id="MLA000000")
+        
+        assert result.items == []
+        assert result.total_count == 0
+        mock_repo.search_by_category.assert_not_called()
+        mock_repo.find_all.assert_not_called()
+    
+    def test_search_service_query_ignores_unknown_category(self, repo):
+        """Test búsqueda por texto - la categoría no participa como antes."""
+        service = SearchService(repo)
+        
+        plain = service.search_items(query="samsung")
+        with_category = service.search_items(query="samsung", category_id="MLA000000")
+        
+        assert plain.total_count > 0
+        assert [item.id for item in with_category.items] == [item.id for item in plain.items]
+    
+    def test_search_service_sorting_is_stable(self, repo):
+        """Test ordenamiento por offset - los empates conservan el orden del catálogo."""
+        service = SearchService(repo)
+        items = repo.find_all()
+        
+        for field in ["price", "title", "available_quantity", "sold_quantity", "brand"]:
+            for direction in ["asc", "desc"]:
+                expected = sorted(
+                    items,
+                    key=lambda item: service._get_sort_value(item, field),
+                    reverse=direction == "desc"
+                )
+                result = service.search_items(limit=100, sort_field=field, sort_direction=direction)
+                assert [item.id for item in result.items] == [item.id for item in expected]
+    
+    def test_search_service_cursor_pagination(self, repo):
+        """Test paginación por cursor - debe recorrer el mismo orden que offset sin repetir items."""
+        service = SearchService(repo)
+        
+        # brand y available_quantity tienen empates: el cursor debe respetarlos igual que offset
+        for field in ["price", "brand", "available_quantity"]:
+            for direction in ["asc", "desc"]:
+                criteria = {"sort_field": field, "sort_direction": direction}
+                expected = [item.id for item in service.search_items(limit=100, **criteria).items]
+                
+                seen = []
+                result = service.search_items(limit=3, **criteria)
+                seen.extend(item.id for item in result.items)
+                while result.next_key:
+                    result = service.search_items(limit=3, cursor=result.next_key, **criteria)
+                    seen.extend(item.id for item in result.items)
+                
+                assert seen == expected
+                assert result.has_more is False
+    
+    def test_search_service_recommendations_match_entity_similarity(self, repo):
+        """Test recomendaciones - la tabla por columnas debe puntuar igual que la entidad."""
+        items = repo.find_all()
+        service = SearchService(Mock(spec=["find_all"], find_all=Mock(return_value=items)))
+        service.precompute_recommendations()
+        repository_service = SearchService(repo)
+        
+        for base in items:
+            scored = [
+                (item, base.calculate_similarity_with(item))
+                for item in items if item.id != base.id
+            ]
+            ranked = sorted(
+                (pair for pair in scored if pair[1] > 0),
+                key=lambda pair: (pair[1], pair[0].sold_quantity),
+                reverse=True
+            )
+            expected = [item.id for item, _ in ranked[:5]]
+            assert [item.id for item in service.get_recommendations(base.id, 5)] == expected
+            assert [item.id for item in repository_service.get_recommendations(base.id, 5)] == expected
+
+
+class TestCoalescer:
+    """Tests para la agrupación de requests concurrentes."""
+    
+    def test_concurrent_calls_share_execution(self):
+        """Llamadas concurrentes con la misma clave deben ejecutar el trabajo una sola vez."""
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+        
+        async def scenario():
+            coalescer = Coalescer()
+            results = await asyncio.gather(*(coalescer.run("key", work) for _ in range(5)))
+            # Terminada la ejecución, una nueva llamada vuelve a ejecutar el trabajo
+            await coalescer.run("key", work)
+            return results
+        
+        results = asyncio.run(scenario())
+        assert results == ["result"] * 5
+        assert len(calls) == 2
+
+
+    def test_clear_forgets_inflight_execution(self):
+        """Después de limpiar, una nueva llamada no debe reutilizar la ejecución en curso."""
+        calls = []
+        
+        async def work():
+            calls.append(1)
+            run = len(calls)
+            await asyncio.sleep(0.01)
+            return run
+        
+        async def scenario():
+            coalescer = Coalescer()
+            first = asyncio.ensure_future(coalescer.run("key", work))
+            await asyncio.sleep(0)
+            coalescer.clear()
+            second = await coalescer.run("key", work)
+            return await first, second
+        
+        assert asyncio.run(scenario()) == (1, 2)
+        assert len(calls) == 2
+
+
+class TestResponseCache:
+    """Tests para la caché de respuestas."""
+    
+    def test_get_set_and_eviction(self):
+        """Las entradas se guardan por espacio de nombres y se descartan las más antiguas."""
+        cache = ResponseCache(default_ttl=60, max_entries=2)
+        cache.set("popular", 5, b"five")
+        cache.set("popular", 10, b"ten")
+        assert cache.get("popular", 5) == b"five"
+        assert cache.get("item", 5) is None
+        
+        cache.set("popular", 20, b"twenty")
+        assert cache.get("popular", 5) is None
+        assert cache.get("popular", 20) == b"twenty"
+    
+    def test_cleared_on_repository_reload(self):
+        """Recargar el catálogo debe invalidar las respuestas cacheadas."""
+        repo = JsonItemRepository()
+        cache = ResponseCache()
+        repo.add_reload_listener(cache.clear)
+        cache.set("popular", 10, b"stale")
+        cache.set("available", 10, b"stale")
+        
+        repo.reload_data()
+        
+        assert cache.get("popular", 10) is None
+        assert cache.get("available", 10) is None
+    
+    def test_render_finished_after_reload_not_served(self):
+        """Una respuesta calculada con el catálogo anterior no debe cachearse para la carga nueva."""
+        repo = JsonItemRepository()
+        controller = ItemController(ItemService(repo), SearchService(repo))
+        cache = ResponseCache()
+        coalescer = Coalescer()
+        repo.add_reload_listener(cache.clear)
+        repo.add_reload_listener(coalescer.clear)
+        app = FastAPI()
+        app.include_router(make_router(controller, cache, ItemJsonCache(), coalescer))
+        
+        renders = []
+        get_item_by_id = controller.get_item_by_id
+        
+        def reloading_get_item_by_id(item_id):
+            renders.append(item_id)
+            if len(renders) == 1:
+                # La recarga ocurre mientras se calcula la primera respuesta
+                repo.reload_data()
+            return get_item_by_id(item_id)
+        
+        controller.get_item_by_id = reloading_get_item_by_id
+        with TestClient(app) as client:
+            assert client.get("/api/v1/items/MLA111222333").status_code == 200
+            assert client.get("/api/v1/items/MLA111222333").status_code == 200
+            assert client.get("/api/v1/items/MLA111222333").status_code == 200
+        
+        assert len(renders) == 2
+
+
+class TestItemJsonCache:
+    """Tests para la caché del JSON de cada item."""
+    
+    def test_item_json_cache_matches_to_dict(self, repo):
+        """El JSON cacheado de cada item debe ser el de to_dict()."""
+        cache = ItemJsonCache()
+        items, _ = repo.find_all_paginated(3, 0)
+        
+        assert cache.encode_list(items) == dumps([item.to_dict() for item in items])
+        assert cache.encode(items[0]) is cache.encode(items[0])
+        
+        cache.clear()
+        assert cache.encode_list([]) == b"[]"
+
+
+class TestListingMemo:
+    """Tests para los listados memorizados del controlador."""
+    
+    def test_controller_listings_memoized_until_reload(self):
+        """Los listados por límite se reutilizan hasta que se recarga el catálogo."""
+        repo = JsonItemRepository()
+        controller = ItemController(ItemService(repo), SearchService(repo))
+        repo.add_reload_listener(controller.clear_cache)
+        
+        popular = controller.get_popular_items(3)
+        available = controller.get_available_items(3)
+        assert controller.get_popular_items(3) is popular
+        assert controller.get_available_items(3) is available
+        assert controller.get_popular_items(5) is not popular
+        
+        repo.reload_data()
+        
+        assert controller.get_popular_items(3) is not popular
+        assert controller.get_popular_items(3) == popular
 
 
 class TestRepository:
     """Tests críticos para repositorio."""
     
-    def test_repository_basic_operations(self):
+    def test_repository_basic_operations(self, repo):
         """Test operaciones básicas - crítico para datos."""
-        repo = JsonItemRepository()
-        
         # Debe inicializar correctamente
         assert repo is not None
         
         # Debe cargar items
-        items = repo.find_all()
+        items, total = repo.find_all_paginated(3, 0)
         assert isinstance(items, list)
+        assert total == repo.count()
         
         # Cada item debe ser válido
-        for item in items[:3]:  # Solo primeros 3 para eficiencia
+        for item in items:  # Solo primeros 3 para eficiencia
             assert isinstance(item, Item)
             assert item.id is not None
             assert item.title is not None
             assert item.price.amount >= 0
     
-    def test_repository_find_by_id(self):
+    def test_repository_loads_every_item(self, repo):
+        """Test carga completa - colecciones en null no deben descartar el item."""
+        with open(repo.get_stats()["data_file"], encoding="utf-8") as file:
+            raw_items = json.load(file)
+        assert repo.count() == len(raw_items)
+        
+        # MLA951753486 tiene "category_path": null en el JSON
+        item = repo.find_by_id("MLA951753486")
+        assert item is not None
+        assert item.to_dict()["category_path"] == []
+    
+    def test_repository_find_by_id(self, repo):
         """Test búsqueda por ID - operación crítica."""
-        repo = JsonItemRepository()
-        items = repo.find_all()
+        first_item = repo.first()
         
-        if items:
+        if first_item:
             # Test con item existente
-            first_item = items[0]
             found_item = repo.find_by_id(first_item.id)
             assert found_item is not None
             assert found_item.id == first_item.id
@@ -158,22 +415,54 @@ class TestRepository:
         # Test con item inexistente
         not_found = repo.find_by_id("MLA999999999")
         assert not_found is None
+    
+    def test_repository_search_by_term_uses_index(self, repo):
+        """Test búsqueda indexada - debe coincidir con el recorrido lineal."""
+        items = repo.find_all()
+        
+        for term in ["iphone", "sam", "pb-10", "a", "15 pro", "-", "inexistente"]:
+            expected = [item.id for item in items if item.matches_search_term(term)]
+            assert [item.id for item in repo.search_by_term(term)] == expected
+    
+    def test_repository_category_and_brand_indexes(self, repo):
+        """Test índices por categoría y marca - deben coincidir con el recorrido lineal."""
+        items = repo.find_all()
+        
+        for item in items:
+            expected = [other.id for other in items if other.category_id == item.category_id]
+            assert [found.id for found in repo.search_by_category(item.category_id)] == expected
+            
+            brand = item.get_brand()
+            if brand:
+                expected = [other.id for other in items if (other.get_brand() or "").lower() == brand.lower()]
+                assert [found.id for found in repo.search_by_brand(brand.upper())] == expected
+        
+        assert repo.search_by_category("MLA_INEXISTENTE") == []
+    
+    def test_repository_precomputed_listings(self, repo):
+        """Test listados precalculados - deben respetar el orden documentado."""
+        items = repo.find_all()
+        
+        most_sold = repo.find_most_sold(5)
+        assert most_sold == sorted(items, key=lambda item: item.sold_quantity, reverse=True)[:5]
+        
+        most_available = repo.find_most_available(len(items))
+        assert all(item.is_available for item in most_available)
+        assert [item.available_quantity for item in most_available] == sorted(
+            (item.available_quantity for item in items if item.is_available), reverse=True
+        )
 
 
 class TestAPIIntegration:
     """Tests críticos para API."""
     
-    @pytest.fixture
-    def client(self):
-        """Cliente de test para API."""
-        return TestClient(app)
-    
     def test_health_endpoint(self, client):
         """Test health check - crítico para monitoreo."""
         response = client.get("/api/v1/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ok"
+        assert response.headers["cache-control"] == "no-store"
     
     def test_search_endpoint_basic(self, client):
         """Test búsqueda básica - endpoint principal."""
@@ -194,6 +483,68 @@ class TestAPIIntegration:
         assert len(data["data"]) <= 3
         assert data["meta"]["limit"] == 3
     
+    def test_search_streamed_page(self, client):
+        """Test búsqueda con límite alto - la respuesta en partes debe ser JSON válido."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        response = client.get("/api/v1/items?limit=50", headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["data"]) == data["meta"]["total"]
+        assert data["meta"]["limit"] == 50
+    
+    def test_openapi_schema_warmed_at_startup(self, client):
+        """Test esquema OpenAPI - debe generarse en el arranque, no en el primer request."""
+        assert client.app.openapi_schema is not None
+        response = client.get("/openapi.json")
+        assert response.status_code == 200
+        assert response.json() == client.app.openapi_schema
+    
+    def test_search_invalid_params(self, client):
+        """Test validación de parámetros - debe responder 400 con el campo inválido."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        response = client.get("/api/v1/items?limit=0", headers=headers)
+        assert response.status_code == 400
+        data = response.json()
+        assert data["code"] == "INVALID_SEARCH_CRITERIA"
+        assert "Field: limit" in data["cause"]
+    
+    def test_search_cursor_meta_omits_offset(self, client):
+        """Test cursor - la respuesta no debe informar offset ni página, que el cursor ignora."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        first = client.get("/api/v1/items?sort_field=price&limit=3", headers=headers).json()
+        assert first["meta"]["offset"] == 0
+        assert first["meta"]["current_page"] == 1
+        
+        cursor = first["meta"]["next_cursor"]
+        response = client.get(f"/api/v1/items?sort_field=price&limit=3&offset=6&cursor={cursor}", headers=headers)
+        assert response.status_code == 200
+        meta = response.json()["meta"]
+        assert meta["offset"] is None
+        assert "current_page" not in meta
+        
+        by_offset = client.get("/api/v1/items?sort_field=price&limit=3&offset=3", headers=headers).json()
+        assert [item["id"] for item in response.json()["data"]] == [item["id"] for item in by_offset["data"]]
+    
+    def test_search_invalid_cursor(self, client):
+        """Test cursor con clave no escalar - debe responder 400, no 500."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        # Cursor que decodifica a [[], "x"]
+        response = client.get("/api/v1/items?cursor=W1tdLCJ4Il0=&sort_field=price", headers=headers)
+        assert response.status_code == 400
+        assert response.json()["code"] == "INVALID_SEARCH_CRITERIA"
+    
+    def test_item_not_found_documented_as_returned(self, client):
+        """Test OpenAPI - el error documentado para un item inexistente debe coincidir con la respuesta real."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        responses = client.app.openapi()["paths"]["/api/v1/items/{item_id}"]["get"]["responses"]
+        assert "404" not in responses
+        example = responses["400"]["content"]["application/json"]["example"]
+        
+        response = client.get("/api/v1/items/MLA999999999", headers=headers)
+        assert response.status_code == 400
+        assert response.json()["code"] == example["code"]
+        assert response.json()["status"] == example["status"]
+    
     def test_item_by_id_not_found(self, client):
         """Test manejo de errores 404 - crítico para UX."""
         headers = {"X-API-Key": "meli2024abc123xyz789"}
@@ -224,3 +575,34 @@ class TestAPIIntegration:
         # Todos deben tener stock
         for item in data["data"]:
             assert item["available_quantity"] > 0
+    
+    def test_item_etag_not_modified(self, client):
+        """Test caché HTTP - ETag válido debe devolver 304 sin cuerpo."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        response = client.get("/api/v1/items/MLA111222333", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "private, max-age=60"
+        etag = response.headers["ETag"]
+        
+        cached = client.get("/api/v1/items/MLA111222333", headers={**headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+    
+    def test_authenticated_responses_not_shared(self, client):
+        """Test caché HTTP - respuestas con API key no deben guardarse en cachés compartidos."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        response = client.get("/api/v1/items/popular?limit=5", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "private, max-age=60"
+        assert response.headers["Vary"] == "X-API-Key"
+    
+    def test_popular_etag_not_modified(self, client):
+        """Test caché HTTP - los listados cacheados también responden 304 con ETag válido."""
+        headers = {"X-API-Key": "meli2024abc123xyz789"}
+        response = client.get("/api/v1/items/popular?limit=5", headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        
+        cached = client.get("/api/v1/items/popular?limit=5", headers={**headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
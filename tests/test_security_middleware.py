@@ -3,44 +3,43 @@ Tests para el middleware de seguridad.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
 
+# El rate limiter guarda sus contadores en memoria del proceso: con pytest-xdist
+# estos tests comparten worker para que el consumo de cuota sea predecible
+@pytest.mark.xdist_group("rate_limit")
 class TestSecurityMiddleware:
     """Tests para el middleware de seguridad."""
     
-    def test_health_endpoint_public_access(self):
+    def test_health_endpoint_public_access(self, client):
         """El endpoint de health debe ser accesible sin API key."""
         response = client.get("/api/v1/health")
         assert response.status_code == 200
     
-    def test_protected_endpoint_without_api_key(self):
+    def test_protected_endpoint_without_api_key(self, client):
         """Los endpoints protegidos deben requerir API key."""
         response = client.get("/api/v1/items/MLA111222333")
         assert response.status_code == 401
         assert "AUTHENTICATION_REQUIRED" in response.json()["error"]["code"]
     
-    def test_protected_endpoint_with_valid_api_key_header(self):
+    def test_protected_endpoint_with_valid_api_key_header(self, client):
         """Debe permitir acceso con API key válida en header."""
         headers = {"X-API-Key": "meli2024abc123xyz789"}
         response = client.get("/api/v1/items/MLA111222333", headers=headers)
         assert response.status_code in [200, 404]  # 404 si el item no existe
     
-    def test_protected_endpoint_with_valid_api_key_query(self):
+    def test_protected_endpoint_with_valid_api_key_query(self, client):
         """Debe permitir acceso con API key válida en query parameter."""
         response = client.get("/api/v1/items/MLA111222333?api_key=meli2024abc123xyz789")
         assert response.status_code in [200, 404]  # 404 si el item no existe
     
-    def test_protected_endpoint_with_invalid_api_key(self):
+    def test_protected_endpoint_with_invalid_api_key(self, client):
         """Debe rechazar API keys inválidas."""
         headers = {"X-API-Key": "invalid-key"}
         response = client.get("/api/v1/items/MLA111222333", headers=headers)
         assert response.status_code == 401
         assert "Invalid API Key" in response.json()["error"]["message"]
     
-    def test_security_headers_present(self):
+    def test_security_headers_present(self, client):
         """Debe agregar headers de seguridad a las respuestas."""
         response = client.get("/api/v1/health")
         
@@ -53,13 +52,13 @@ class TestSecurityMiddleware:
         assert "Strict-Transport-Security" in response.headers
         assert "X-API-Version" in response.headers
     
-    def test_api_key_authentication(self):
+    def test_api_key_authentication(self, client):
         """Debe autenticar correctamente con API key válida."""
         headers = {"X-API-Key": "meli2024abc123xyz789"}
         response = client.get("/api/v1/items", headers=headers)
         assert response.status_code == 200
     
-    def test_rate_limiting_basic(self):
+    def test_rate_limiting_basic(self, client):
         """Test básico de rate limiting (no exhaustivo por tiempo)."""
         headers = {"X-API-Key": "meli2024abc123xyz789"}
         
@@ -68,7 +67,7 @@ class TestSecurityMiddleware:
             response = client.get("/api/v1/health", headers=headers)
             assert response.status_code == 200
     
-    def test_docs_access_without_auth(self):
+    def test_docs_access_without_auth(self, client):
         """La documentación debe ser accesible sin autenticación."""
         response = client.get("/docs")
         assert response.status_code == 200